@@ -85,6 +85,11 @@ nodes:
   - containerPort: 443
     hostPort: 443
     protocol: TCP
+# Image pulls go through the local pull-through mirrors (04-create-cluster/image-cache.sh)
+containerdConfigPatches:
+- |-
+  [plugins."io.containerd.grpc.v1.cri".registry]
+    config_path = "/etc/containerd/certs.d"
 EOF
 log_success "kind-config.yaml created"
 
@@ -90,6 +90,12 @@ if [ -f "kind-config.yaml" ]; then
   else
     log_fail "kind-config.yaml missing required fields"
   fi
+
+  if grep -q 'config_path = "/etc/containerd/certs.d"' kind-config.yaml; then
+    log_pass "kind-config.yaml points containerd at the image cache mirrors"
+  else
+    log_fail "kind-config.yaml missing containerd config_path (image cache)"
+  fi
 else
   log_fail "kind-config.yaml not found"
 fi
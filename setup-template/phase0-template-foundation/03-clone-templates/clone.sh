@@ -48,7 +48,7 @@ cd "$PROJECT_ROOT"
 if [ -f "apps/podinfo/base/kustomization.yaml" ]; then
   log_warning "Manifests already exist in apps/podinfo/base/"
   echo ""
-  read -p "Overwrite existing manifests? (y/N): " -n 1 -r
+  read -p "Overwrite existing manifests? (y/N): " -n 1 -r || REPLY=""
   echo
   if [[ ! $REPLY =~ ^[Yy]$ ]]; then
     echo ""
@@ -8,8 +8,10 @@
 #
 # Actions:
 #   - Creates kind cluster "agent-k8s-local"
-#   - Uses kind-config.yaml (ports 80/443 mapped)
+#   - Starts the local registry mirrors (image-cache.sh start)
+#   - Uses kind-config.yaml (ports 80/443 mapped, containerd mirror config)
 #   - Waits for cluster to be ready
+#   - Points containerd at the mirrors and preloads images.lock (image-cache.sh)
 #
 # Usage:
 #   ./setup-template/phase1/04-create-cluster/create.sh
@@ -48,7 +50,7 @@ cd "$PROJECT_ROOT"
 if kind get clusters 2>/dev/null | grep -q "agent-k8s-local"; then
   log_warning "Cluster 'agent-k8s-local' already exists"
   echo ""
-  read -p "Delete and recreate? (y/N): " -n 1 -r
+  read -p "Delete and recreate? (y/N): " -n 1 -r || REPLY=""
   echo
   if [[ $REPLY =~ ^[Yy]$ ]]; then
     log_info "Deleting existing cluster..."
@@ -69,6 +71,11 @@ if kind get clusters 2>/dev/null | grep -q "agent-k8s-local"; then
   fi
 fi
 
+SCRIPT_DIR="$PROJECT_ROOT/setup-template/phase0-template-foundation/04-create-cluster"
+
+# Local registry mirrors must be up before the node pulls anything
+"$SCRIPT_DIR/image-cache.sh" start
+
 # Create cluster
 log_info "Creating kind cluster (this takes ~60 seconds)..."
 if [ -f "kind-config.yaml" ]; then
@@ -85,6 +92,10 @@ log_info "Waiting for cluster to be ready..."
 kubectl wait --for=condition=Ready nodes --all --timeout=120s
 log_success "Cluster is ready"
 
+# Route pulls through the mirrors and preload the digest-pinned images
+"$SCRIPT_DIR/image-cache.sh" configure
+"$SCRIPT_DIR/image-cache.sh" preload
+
 # Show cluster info
 log_info "Cluster information:"
 echo ""
@@ -0,0 +1,152 @@
+#!/bin/bash
+################################################################################
+# 📦 Block 4 helper: Local Image Cache for kind
+#
+# Purpose: Keeps every image Phase 0 pulls in local pull-through registry
+#          mirrors (Docker volumes survive `kind delete cluster`) and preloads
+#          the digest-pinned images from images.lock into the kind node under the
+#          repo:tag refs the manifests pull, so those pulls find the image in place
+# Runtime: ~5 seconds (warm cache), first run as fast as a normal pull
+#
+# Commands:
+#   start      Start one registry:2 mirror per upstream registry (before kind create)
+#   configure  Point the node's containerd at the mirrors (after kind create)
+#   preload    Pull all images from images.lock by digest and tag them repo:tag, in parallel
+#   lock       Write images.lock from the images running in the cluster
+#              (run after a successful Phase 0, commit the result)
+#
+# Mirrors:
+#   docker.io, registry.k8s.io, quay.io, ghcr.io → kind-cache-<registry> containers
+#   on the "kind" Docker network (containerd hosts.toml, config_path in kind-config.yaml)
+#
+# Usage:
+#   ./setup-template/phase0-template-foundation/04-create-cluster/image-cache.sh start
+################################################################################
+
+set -euo pipefail
+
+# Color codes
+RESET='\033[0m'
+GREEN='\033[0;32m'
+CYAN='\033[0;36m'
+YELLOW='\033[1;33m'
+
+CLUSTER_NAME="agent-k8s-local"
+REGISTRY_IMAGE="registry:2.8.3"
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+LOCK_FILE="${IMAGE_LOCK_FILE:-$SCRIPT_DIR/images.lock}"
+PRELOAD_PARALLEL="${PRELOAD_PARALLEL:-6}"
+
+# Registry host → upstream URL
+MIRRORS=(
+  "docker.io=https://registry-1.docker.io"
+  "registry.k8s.io=https://registry.k8s.io"
+  "quay.io=https://quay.io"
+  "ghcr.io=https://ghcr.io"
+)
+
+log_info() {
+  echo -e "${CYAN}➜ $1${RESET}"
+}
+
+log_success() {
+  echo -e "${GREEN}✓ $1${RESET}"
+}
+
+log_warning() {
+  echo -e "${YELLOW}⚠ $1${RESET}"
+}
+
+mirror_name() {
+  echo "kind-cache-${1//./-}"
+}
+
+start_mirrors() {
+  log_info "Starting local registry mirrors..."
+  for entry in "${MIRRORS[@]}"; do
+    local host="${entry%%=*}" upstream="${entry#*=}" name
+    name=$(mirror_name "$host")
+    if [ "$(docker inspect -f '{{.State.Running}}' "$name" 2>/dev/null)" = "true" ]; then
+      continue
+    fi
+    docker rm -f "$name" >/dev/null 2>&1 || true
+    # The named volume holds the cached blobs and outlives the container and the cluster
+    docker run -d --restart=always --name "$name" \
+      -v "$name:/var/lib/registry" \
+      -e REGISTRY_PROXY_REMOTEURL="$upstream" \
+      "$REGISTRY_IMAGE" >/dev/null
+  done
+  log_success "Registry mirrors running ($(docker volume ls -q --filter name=kind-cache- | wc -l) cache volumes)"
+}
+
+configure_nodes() {
+  log_info "Pointing containerd at the registry mirrors..."
+  for entry in "${MIRRORS[@]}"; do
+    docker network connect kind "$(mirror_name "${entry%%=*}")" >/dev/null 2>&1 || true  # Already connected
+  done
+  for node in $(kind get nodes --name "$CLUSTER_NAME"); do
+    for entry in "${MIRRORS[@]}"; do
+      local host="${entry%%=*}" upstream="${entry#*=}"
+      docker exec -i "$node" sh -c "mkdir -p /etc/containerd/certs.d/$host && cat > /etc/containerd/certs.d/$host/hosts.toml" <<EOF
+server = "$upstream"
+
+[host."http://$(mirror_name "$host"):5000"]
+  capabilities = ["pull", "resolve"]
+EOF
+    done
+  done
+  log_success "containerd mirrors configured"
+}
+
+preload_images() {
+  if [ ! -s "$LOCK_FILE" ]; then
+    log_warning "No $(basename "$LOCK_FILE") yet - skipping preload (images are still cached by the mirrors)"
+    echo "  Create it after a successful run: $0 lock"
+    return 0
+  fi
+  local count
+  count=$(grep -cv '^\s*\(#\|$\)' "$LOCK_FILE")
+  log_info "Preloading $count digest-pinned images ($PRELOAD_PARALLEL parallel)..."
+  for node in $(kind get nodes --name "$CLUSTER_NAME"); do
+    # Pull by digest, then tag the result as repo:tag - the manifests pull by tag, and only an
+    # image stored under that exact ref satisfies their IfNotPresent lookup
+    grep -v '^\s*\(#\|$\)' "$LOCK_FILE" \
+      | xargs -P "$PRELOAD_PARALLEL" -I{} docker exec "$node" sh -c '
+          set -e
+          ref="${1%@*}" digest="${1#*@}" tagged=""
+          case "${ref##*/}" in *:*) tagged="$ref" ref="${ref%:*}" ;; esac
+          pinned="$ref@$digest"
+          crictl pull "$pinned" >/dev/null
+          [ -z "$tagged" ] || ctr -n k8s.io images tag --force "$pinned" "$tagged" >/dev/null
+        ' _ {}
+  done
+  log_success "$count images preloaded and tagged under their manifest refs"
+}
+
+write_lock() {
+  log_info "Collecting images from running pods..."
+  # image (tag) + imageID (repo@sha256) → "repo:tag@sha256:..."; .image is the normalized ref the kubelet
+  # resolved the manifest's tag to, so preload tags exactly that. kind's own images ship in the node image
+  kubectl get pods -A -o jsonpath='{range .items[*]}{range .status.initContainerStatuses[*]}{.image}{" "}{.imageID}{"\n"}{end}{range .status.containerStatuses[*]}{.image}{" "}{.imageID}{"\n"}{end}{end}' \
+    | grep -v -e 'kindest/' -e 'registry.k8s.io/kube-' -e 'registry.k8s.io/coredns' -e 'registry.k8s.io/etcd' \
+    | awk '$2 ~ /@sha256:/ { split($1, ref, "@"); split($2, id, "@"); print ref[1] "@" id[2] }' \
+    | sort -u > "$LOCK_FILE.tmp"
+  {
+    echo "# Phase 0 images, pinned by digest (generated by 04-create-cluster/image-cache.sh lock)"
+    echo "# Regenerate after changing chart or Argo CD versions, then commit."
+    cat "$LOCK_FILE.tmp"
+  } > "$LOCK_FILE"
+  rm -f "$LOCK_FILE.tmp"
+  log_success "Wrote $(grep -cv '^#' "$LOCK_FILE") images to $LOCK_FILE"
+}
+
+case "${1:-}" in
+  start) start_mirrors ;;
+  configure) configure_nodes ;;
+  preload) preload_images ;;
+  lock) write_lock ;;
+  *)
+    echo "Usage: $0 start|configure|preload|lock"
+    exit 1
+    ;;
+esac
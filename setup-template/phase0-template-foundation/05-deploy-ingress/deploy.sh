@@ -44,7 +44,7 @@ echo ""
 if kubectl get namespace ingress-nginx >/dev/null 2>&1; then
   log_warning "Namespace 'ingress-nginx' already exists"
   echo ""
-  read -p "Redeploy ingress-nginx? (y/N): " -n 1 -r
+  read -p "Redeploy ingress-nginx? (y/N): " -n 1 -r || REPLY=""
   echo
   if [[ ! $REPLY =~ ^[Yy]$ ]]; then
     echo ""
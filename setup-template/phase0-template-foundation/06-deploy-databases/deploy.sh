@@ -55,7 +55,7 @@ echo ""
 if kubectl get namespace demo-platform >/dev/null 2>&1; then
   log_warning "Namespace 'demo-platform' already exists"
   echo ""
-  read -p "Redeploy databases? This will DELETE existing data! (y/N): " -n 1 -r
+  read -p "Redeploy databases? This will DELETE existing data! (y/N): " -n 1 -r || REPLY=""
   echo
   if [[ ! $REPLY =~ ^[Yy]$ ]]; then
     echo ""
@@ -72,7 +72,7 @@ if kubectl get namespace demo-platform >/dev/null 2>&1; then
   helm uninstall postgresql -n demo-platform 2>/dev/null || true
   helm uninstall redis -n demo-platform 2>/dev/null || true
   kubectl delete namespace demo-platform --timeout=60s || true
-  sleep 5
+  kubectl wait --for=delete namespace/demo-platform --timeout=120s 2>/dev/null || true
   log_success "Existing deployments removed"
 fi
 
@@ -88,8 +88,8 @@ helm repo add bitnami https://charts.bitnami.com/bitnami 2>&1 | grep -v "already
 helm repo update 2>&1 | grep -v "Hang tight" || true
 log_success "Helm repository ready"
 
-# Deploy PostgreSQL
-log_info "Deploying PostgreSQL..."
+# Deploy PostgreSQL and Redis concurrently (independent releases, each waits on its own pods)
+log_info "Deploying PostgreSQL and Redis in parallel..."
 helm install postgresql bitnami/postgresql \
   --namespace demo-platform \
   --set auth.username=demouser \
@@ -101,12 +101,9 @@ helm install postgresql bitnami/postgresql \
   --set primary.resources.limits.cpu=500m \
   --set primary.resources.limits.memory=512Mi \
   --wait \
-  --timeout=5m
+  --timeout=5m &
+PG_PID=$!
 
-log_success "PostgreSQL deployed"
-
-# Deploy Redis
-log_info "Deploying Redis..."
 helm install redis bitnami/redis \
   --namespace demo-platform \
   --set auth.password=redispass \
@@ -117,20 +114,19 @@ helm install redis bitnami/redis \
   --set master.resources.limits.cpu=200m \
   --set master.resources.limits.memory=256Mi \
   --wait \
-  --timeout=5m
+  --timeout=5m &
+REDIS_PID=$!
 
+wait $PG_PID
+log_success "PostgreSQL deployed"
+wait $REDIS_PID
 log_success "Redis deployed"
 
 # Wait for pods to be fully ready
 log_info "Waiting for database pods to be ready..."
 kubectl wait --namespace demo-platform \
   --for=condition=ready pod \
-  --selector=app.kubernetes.io/name=postgresql \
-  --timeout=180s
-
-kubectl wait --namespace demo-platform \
-  --for=condition=ready pod \
-  --selector=app.kubernetes.io/name=redis \
+  --selector='app.kubernetes.io/name in (postgresql,redis)' \
   --timeout=180s
 
 log_success "All database pods are ready"
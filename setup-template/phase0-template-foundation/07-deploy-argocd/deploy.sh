@@ -55,7 +55,7 @@ echo ""
 if kubectl get namespace argocd >/dev/null 2>&1; then
   log_warning "Namespace 'argocd' already exists"
   echo ""
-  read -p "Redeploy Argo CD? (y/N): " -n 1 -r
+  read -p "Redeploy Argo CD? (y/N): " -n 1 -r || REPLY=""
   echo
   if [[ ! $REPLY =~ ^[Yy]$ ]]; then
     echo ""
@@ -79,7 +79,7 @@ if kubectl get namespace argocd >/dev/null 2>&1; then
   
   log_info "Uninstalling existing Argo CD..."
   kubectl delete namespace argocd --timeout=60s || true
-  sleep 5
+  kubectl wait --for=delete namespace/argocd --timeout=120s 2>/dev/null || true
   log_success "Existing deployment removed"
 fi
 
@@ -93,9 +93,10 @@ log_info "Installing Argo CD ${ARGOCD_VERSION}..."
 kubectl apply -n argocd -f https://raw.githubusercontent.com/argoproj/argo-cd/${ARGOCD_VERSION}/manifests/install.yaml
 log_success "Argo CD manifests applied"
 
-# Wait for Argo CD server to be created
-log_info "Waiting for Argo CD components to initialize..."
-sleep 10
+# Wait for the Argo CD CRDs to be served (the apply already created the services)
+log_info "Waiting for Argo CD CRDs to be established..."
+kubectl wait --for condition=established --timeout=60s \
+  crd/applications.argoproj.io crd/appprojects.argoproj.io
 
 # Patch Argo CD server service to ClusterIP (for Ingress)
 log_info "Configuring Argo CD server for Ingress..."
@@ -109,7 +110,10 @@ log_success "Insecure mode enabled"
 
 # Create Ingress
 log_info "Creating Ingress for argocd.local..."
-cat <<EOF | kubectl apply -f -
+# Retried: when Block 5 runs in parallel, the ingress-nginx admission webhook
+# can be registered before its endpoint is serving
+for attempt in $(seq 1 30); do
+  if kubectl apply -f - >/dev/null <<EOF
 apiVersion: networking.k8s.io/v1
 kind: Ingress
 metadata:
@@ -133,14 +137,21 @@ spec:
             port:
               number: 80
 EOF
+  then
+    break
+  fi
+  if [ "$attempt" -eq 30 ]; then
+    log_warning "Ingress could not be created (is ingress-nginx running?)"
+    exit 1
+  fi
+  sleep 2
+done
 log_success "Ingress created"
 
 # Wait for Argo CD server to be ready
 log_info "Waiting for Argo CD server to be ready (this may take 2-3 minutes)..."
-kubectl wait --namespace argocd \
-  --for=condition=ready pod \
-  --selector=app.kubernetes.io/name=argocd-server \
-  --timeout=300s
+# set env triggered a new rollout; wait for it instead of the pods of the old ReplicaSet
+kubectl rollout status deployment/argocd-server -n argocd --timeout=300s
 log_success "Argo CD server is ready"
 
 # Get admin password
@@ -46,7 +46,7 @@ echo ""
 if kubectl get namespace tenant-demo >/dev/null 2>&1; then
   log_warning "Namespace 'tenant-demo' already exists"
   echo ""
-  read -p "Redeploy podinfo? (y/N): " -n 1 -r
+  read -p "Redeploy podinfo? (y/N): " -n 1 -r || REPLY=""
   echo
   if [[ ! $REPLY =~ ^[Yy]$ ]]; then
     echo ""
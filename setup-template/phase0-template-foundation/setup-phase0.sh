@@ -4,29 +4,47 @@
 #
 # Purpose: Complete Kubernetes platform with all dependencies for local development
 # ROADMAP: Phase 0 (Foundation Layer - Blocks 1-8)
-# Runtime: ~8-10 minutes total
+# Runtime: ~4-5 minutes total (warm image cache), ~6-7 minutes on first run
 #
 # Blocks Overview:
 # 01: Install Tools (Docker, kind, kubectl, Helm, Argo CD CLI, Task)
 # 02: Create Project Structure (apps/, clusters/, infrastructure/, policies/)
 # 03: Clone Template Manifests (podinfo demo application)
-# 04: Create kind Cluster (agent-k8s-local)
+# 04: Create kind Cluster (agent-k8s-local, local image cache)
 # 05: Deploy Ingress-Nginx (Helm)
 # 06: Deploy Databases (PostgreSQL + Redis via Helm)
 # 07: Deploy Argo CD (GitOps)
 # 08: Deploy podinfo Demo (Helm, connected to Redis)
 #
+# Execution (dependency graph, independent blocks run in parallel):
+#   01 ─────┬──► 04 ──┬──► 05 ──┐
+#   02 ──┬──┘         ├──► 06 ──┼──► 08
+#        │            └──► 07   │
+#        └──► 03 ───────────────┘
+#   A block starts as soon as the tests of all blocks it depends on passed.
+#   Block 4 waits for Block 2, which writes the kind-config.yaml it reads.
+#   Block 7's test also waits for Block 5 (it curls argocd.local via the ingress).
+#
 # Result:
 #   ✅ Complete K8s platform ready for your applications
 #   ✅ http://demo.localhost (podinfo demo app)
 #   ✅ http://argocd.local (Argo CD UI)
 #   ✅ PostgreSQL + Redis ready for Hot-Reload pattern
 #
+# Timing report:
+#   Per-task start/duration table, compared with the previous successful run
+#   Written to .phase0-runs/<run-id>/timings.tsv (logs: <block>.log, <block>.test.log)
+#
 # Exit behavior:
-#   - Stops on first test failure
-#   - Shows progress with block numbers
+#   - Stops scheduling on first failure, lets running blocks finish
+#   - Shows the log tail of the failed block
 #   - Final result: ✅ or ❌
 #
+# Environment:
+#   PHASE0_JOBS=4             Max blocks running at once (1 = sequential)
+#   PHASE0_REPORT_DIR=<dir>   Where run reports go (default: .phase0-runs)
+#   PHASE0_BASELINE=<file>    timings.tsv to compare against (default: previous run)
+#
 # Usage:
 #   ./setup-template/phase0-template-foundation/setup-phase0.sh
 ################################################################################
@@ -65,12 +83,79 @@ log_error() {
   echo -e "${RED}✗ $1${RESET}"
 }
 
+log_start() {
+  echo -e "${CYAN}▶ $1${RESET}"
+}
+
 # Project root
 PROJECT_ROOT="$(cd "$(dirname "$0")/../.." && pwd)"
+PHASE0_DIR="$PROJECT_ROOT/setup-template/phase0-template-foundation"
 cd "$PROJECT_ROOT"
 
-# Start
-START_TIME=$(date +%s)
+# Blocks in display order, with their deploy script
+BLOCKS=(
+  01-install-tools
+  02-create-structure
+  03-clone-templates
+  04-create-cluster
+  05-deploy-ingress
+  06-deploy-databases
+  07-deploy-argocd
+  08-deploy-podinfo
+)
+declare -A DEPLOY_SCRIPT=(
+  [01-install-tools]=install.sh
+  [02-create-structure]=create.sh
+  [03-clone-templates]=clone.sh
+  [04-create-cluster]=create.sh
+  [05-deploy-ingress]=deploy.sh
+  [06-deploy-databases]=deploy.sh
+  [07-deploy-argocd]=deploy.sh
+  [08-deploy-podinfo]=deploy.sh
+)
+
+# Block dependencies: a block's deploy starts after the tests of these blocks passed
+declare -A DEPENDS_ON=(
+  [01-install-tools]=""
+  [02-create-structure]=""
+  [03-clone-templates]="02-create-structure"
+  [04-create-cluster]="01-install-tools 02-create-structure"  # 02 writes kind-config.yaml
+  [05-deploy-ingress]="04-create-cluster"
+  [06-deploy-databases]="04-create-cluster"
+  [07-deploy-argocd]="04-create-cluster"
+  [08-deploy-podinfo]="03-clone-templates 05-deploy-ingress 06-deploy-databases"
+)
+
+# Extra dependencies of a block's test (beyond its own deploy)
+declare -A TEST_DEPENDS_ON=(
+  [07-deploy-argocd]="05-deploy-ingress"
+)
+
+PHASE0_JOBS="${PHASE0_JOBS:-4}"
+if [ "$PHASE0_JOBS" -gt 1 ] && ! { [ "${BASH_VERSINFO[0]}" -gt 5 ] || { [ "${BASH_VERSINFO[0]}" -eq 5 ] && [ "${BASH_VERSINFO[1]}" -ge 1 ]; }; }; then
+  echo -e "${YELLOW}⚠ Parallel blocks need bash >= 5.1 (found ${BASH_VERSION}), running sequentially${RESET}"
+  PHASE0_JOBS=1
+fi
+
+# Run report directory
+REPORT_ROOT="${PHASE0_REPORT_DIR:-$PROJECT_ROOT/.phase0-runs}"
+RUN_ID="$(date -u +%Y%m%dT%H%M%SZ)"
+RUN_DIR="$REPORT_ROOT/$RUN_ID"
+
+# Baseline: explicit file, else the latest run without failures
+BASELINE="${PHASE0_BASELINE:-}"
+if [ -z "$BASELINE" ] && [ -d "$REPORT_ROOT" ]; then
+  for dir in $(ls -1d "$REPORT_ROOT"/*/ 2>/dev/null | sort -r); do
+    if [ -s "$dir/timings.tsv" ] && awk -F'\t' '$2 != "ok" { bad = 1 } END { exit bad }' "$dir/timings.tsv"; then
+      BASELINE="${dir%/}/timings.tsv"
+      break
+    fi
+  done
+fi
+
+now_ms() {
+  date +%s%3N
+}
 
 log_header "🚀 Phase 0: Complete Template Foundation Setup          "
 
@@ -78,151 +163,173 @@ echo -e "${CYAN}This will:${RESET}"
 echo "  1. Install required tools (Docker, kind, kubectl, Helm)"
 echo "  2. Create GitOps project structure"
 echo "  3. Clone podinfo template manifests"
-echo "  4. Create local kind cluster"
+echo "  4. Create local kind cluster (with local image cache)"
 echo "  5. Deploy ingress-nginx controller"
 echo "  6. Deploy PostgreSQL + Redis databases"
 echo "  7. Deploy Argo CD (GitOps)"
 echo "  8. Deploy podinfo demo application (connected to Redis)"
 echo ""
-echo -e "${YELLOW}Runtime: ~8-10 minutes${RESET}"
+echo "  Independent blocks run in parallel (up to $PHASE0_JOBS at once)"
+echo ""
+echo -e "${YELLOW}Runtime: ~4-7 minutes${RESET}"
 echo ""
 echo -e "${CYAN}Result:${RESET}"
 echo "  ✅ http://demo.localhost (podinfo)"
 echo "  ✅ http://argocd.local (Argo CD UI)"
 echo "  ✅ PostgreSQL + Redis ready for Hot-Reload"
 echo ""
-read -p "Continue? (Y/n): " -n 1 -r
-echo
-if [[ $REPLY =~ ^[Nn]$ ]]; then
-  echo "Aborted by user"
-  exit 0
-fi
-
-# Block 01: Install Tools
-log_block "Block 1: Installing Tools"
-if ./setup-template/phase0-template-foundation/01-install-tools/install.sh; then
-  log_success "Tools installed"
-  
-  if ./setup-template/phase0-template-foundation/01-install-tools/test.sh; then
-    log_success "Tools validated"
-  else
-    log_error "Tool validation failed"
-    exit 1
+if [ -t 0 ]; then
+  read -p "Continue? (Y/n): " -n 1 -r || REPLY=""
+  echo
+  if [[ $REPLY =~ ^[Nn]$ ]]; then
+    echo "Aborted by user"
+    exit 0
   fi
-else
-  log_error "Tool installation failed"
-  exit 1
-fi
 
-# Block 02: Create Structure
-log_block "Block 2: Creating Project Structure"
-if ./setup-template/phase0-template-foundation/02-create-structure/create.sh; then
-  log_success "Structure created"
-  
-  if ./setup-template/phase0-template-foundation/02-create-structure/test.sh; then
-    log_success "Structure validated"
-  else
-    log_error "Structure validation failed"
-    exit 1
+  # Blocks run without a terminal; ask for the sudo password (Block 1, Block 7 /etc/hosts) up front
+  if ! grep -q "argocd.local" /etc/hosts 2>/dev/null || ! command -v kind >/dev/null 2>&1; then
+    sudo -v || true
   fi
-else
-  log_error "Structure creation failed"
-  exit 1
 fi
 
-# Block 03: Clone Templates
-log_block "Block 3: Cloning Template Manifests"
-if ./setup-template/phase0-template-foundation/03-clone-templates/clone.sh; then
-  log_success "Manifests cloned"
-  
-  if ./setup-template/phase0-template-foundation/03-clone-templates/test.sh; then
-    log_success "Manifests validated"
-  else
-    log_error "Manifests validation failed"
-    exit 1
-  fi
-else
-  log_error "Manifests cloning failed"
-  exit 1
-fi
+# Start (after the prompt, so runs are comparable)
+START_MS=$(now_ms)
+mkdir -p "$RUN_DIR"
+
+# Task graph: every block is a deploy task "<block>" followed by a test task "<block>:test"
+TASKS=()
+declare -A TASK_DEPS TASK_CMD STATE
+for block in "${BLOCKS[@]}"; do
+  TASKS+=("$block" "$block:test")
+  TASK_CMD[$block]="$PHASE0_DIR/$block/${DEPLOY_SCRIPT[$block]}"
+  TASK_CMD[$block:test]="$PHASE0_DIR/$block/test.sh"
+  TASK_DEPS[$block]=""
+  for dep in ${DEPENDS_ON[$block]}; do
+    TASK_DEPS[$block]+=" $dep:test"
+  done
+  TASK_DEPS[$block:test]="$block"
+  for dep in ${TEST_DEPENDS_ON[$block]:-}; do
+    TASK_DEPS[$block:test]+=" $dep:test"
+  done
+  STATE[$block]=pending
+  STATE[$block:test]=pending
+done
 
-# Block 04: Create Cluster
-log_block "Block 4: Creating kind Cluster"
-if ./setup-template/phase0-template-foundation/04-create-cluster/create.sh; then
-  log_success "Cluster created"
-  
-  if ./setup-template/phase0-template-foundation/04-create-cluster/test.sh; then
-    log_success "Cluster validated"
+declare -A RUNNING=() TASK_START=() TASK_DURATION=()
+FAILED_TASK=""
+
+task_log() {
+  echo "$RUN_DIR/${1/:/.}.log"
+}
+
+task_ready() {
+  local dep
+  for dep in ${TASK_DEPS[$1]}; do
+    [ "${STATE[$dep]}" = "ok" ] || return 1
+  done
+}
+
+start_task() {
+  local task="$1"
+  # No terminal for background blocks: their "Redeploy?" prompts take the default (keep existing)
+  "${TASK_CMD[$task]}" </dev/null >"$(task_log "$task")" 2>&1 &
+  RUNNING[$!]="$task"
+  STATE[$task]=running
+  TASK_START[$task]=$(now_ms)
+  log_start "$task"
+}
+
+finish_task() {
+  local pid="$1" rc="$2" task="${RUNNING[$1]}"
+  unset "RUNNING[$pid]"
+  TASK_DURATION[$task]=$(( $(now_ms) - TASK_START[$task] ))
+  local took
+  took=$(awk -v ms="${TASK_DURATION[$task]}" 'BEGIN { printf "%.1fs", ms / 1000 }')
+  if [ "$rc" -eq 0 ]; then
+    STATE[$task]=ok
+    log_success "$task ($took)"
   else
-    log_error "Cluster validation failed"
-    exit 1
+    STATE[$task]=failed
+    log_error "$task failed after $took (exit $rc)"
+    [ -n "$FAILED_TASK" ] || FAILED_TASK="$task"
   fi
-else
-  log_error "Cluster creation failed"
-  exit 1
-fi
+}
 
-# Block 05: Deploy Ingress
-log_block "Block 5: Deploying Ingress-Nginx"
-if ./setup-template/phase0-template-foundation/05-deploy-ingress/deploy.sh; then
-  log_success "Ingress deployed"
-  
-  if ./setup-template/phase0-template-foundation/05-deploy-ingress/test.sh; then
-    log_success "Ingress validated"
-  else
-    log_error "Ingress validation failed"
-    exit 1
+trap 'kill "${!RUNNING[@]}" 2>/dev/null; exit 130' INT TERM
+
+log_block "Running Phase 0 blocks (logs: ${RUN_DIR#$PROJECT_ROOT/})"
+
+while true; do
+  if [ -z "$FAILED_TASK" ]; then
+    for task in "${TASKS[@]}"; do
+      [ "${#RUNNING[@]}" -lt "$PHASE0_JOBS" ] || break
+      if [ "${STATE[$task]}" = "pending" ] && task_ready "$task"; then
+        start_task "$task"
+      fi
+    done
   fi
-else
-  log_error "Ingress deployment failed"
-  exit 1
-fi
+  [ "${#RUNNING[@]}" -gt 0 ] || break
 
-# Block 06: Deploy Databases
-log_block "Block 6: Deploying Databases (PostgreSQL + Redis)"
-if ./setup-template/phase0-template-foundation/06-deploy-databases/deploy.sh; then
-  log_success "Databases deployed"
-  
-  if ./setup-template/phase0-template-foundation/06-deploy-databases/test.sh; then
-    log_success "Databases validated"
+  rc=0
+  if [ "${#RUNNING[@]}" -eq 1 ]; then
+    done_pid="${!RUNNING[*]}"
+    wait "$done_pid" || rc=$?
   else
-    log_error "Database validation failed"
-    exit 1
+    wait -n -p done_pid "${!RUNNING[@]}" || rc=$?
   fi
-else
-  log_error "Database deployment failed"
-  exit 1
-fi
+  finish_task "$done_pid" "$rc"
+done
+
+for task in "${TASKS[@]}"; do
+  [ "${STATE[$task]}" != "pending" ] || STATE[$task]=skipped
+done
 
-# Block 07: Deploy Argo CD
-log_block "Block 7: Deploying Argo CD"
-if ./setup-template/phase0-template-foundation/07-deploy-argocd/deploy.sh; then
-  log_success "Argo CD deployed"
-  
-  if ./setup-template/phase0-template-foundation/07-deploy-argocd/test.sh; then
-    log_success "Argo CD validated"
+# Timing report
+TOTAL_MS=$(( $(now_ms) - START_MS ))
+for task in "${TASKS[@]}"; do
+  if [ -n "${TASK_START[$task]:-}" ]; then
+    printf '%s\t%s\t%d\t%d\n' "$task" "${STATE[$task]}" \
+      "$(( TASK_START[$task] - START_MS ))" "${TASK_DURATION[$task]:-0}"
   else
-    log_error "Argo CD validation failed"
-    exit 1
+    printf '%s\t%s\t\t\n' "$task" "${STATE[$task]}"
   fi
-else
-  log_error "Argo CD deployment failed"
-  exit 1
+done > "$RUN_DIR/timings.tsv"
+printf 'total\t%s\t0\t%d\n' "$([ -z "$FAILED_TASK" ] && echo ok || echo failed)" "$TOTAL_MS" >> "$RUN_DIR/timings.tsv"
+
+log_block "⏱️  Timing Report (run ${RUN_ID})"
+awk -F'\t' -v baseline="${BASELINE:-}" '
+  BEGIN {
+    if (baseline != "") {
+      while ((getline line < baseline) > 0) { split(line, f, "\t"); if (f[4] != "") prev[f[1]] = f[4] }
+    }
+    printf "  %-26s %-8s %9s %10s %10s %9s\n", "Task", "Status", "Start", "Duration", "Previous", "Δ"
+  }
+  {
+    start = ($3 == "") ? "-" : sprintf("%.1fs", $3 / 1000)
+    took  = ($4 == "") ? "-" : sprintf("%.1fs", $4 / 1000)
+    was   = ($1 in prev) ? sprintf("%.1fs", prev[$1] / 1000) : "-"
+    delta = ($1 in prev && $4 != "") ? sprintf("%+.1fs", ($4 - prev[$1]) / 1000) : "-"
+    if ($1 == "total") print ""
+    printf "  %-26s %-8s %9s %10s %10s %9s\n", $1, $2, ($1 == "total" ? "" : start), took, was, delta
+  }
+' "$RUN_DIR/timings.tsv"
+echo ""
+if [ -n "$BASELINE" ]; then
+  echo "  Compared with: ${BASELINE#$PROJECT_ROOT/}"
 fi
+echo "  Report:        ${RUN_DIR#$PROJECT_ROOT/}/timings.tsv"
+echo ""
 
-# Block 08: Deploy podinfo
-log_block "Block 8: Deploying podinfo Demo"
-if ./setup-template/phase0-template-foundation/08-deploy-podinfo/deploy.sh; then
-  log_success "podinfo deployed"
-  
-  if ./setup-template/phase0-template-foundation/08-deploy-podinfo/test.sh; then
-    log_success "podinfo validated"
-  else
-    log_error "podinfo validation failed"
-    exit 1
-  fi
-else
-  log_error "podinfo deployment failed"
+if [ -n "$FAILED_TASK" ]; then
+  log_error "Phase 0 failed in ${FAILED_TASK} - last lines of $(task_log "$FAILED_TASK"):"
+  echo ""
+  tail -n 30 "$(task_log "$FAILED_TASK")"
+  echo ""
+  echo -e "${RED}╔════════════════════════════════════════════════════════╗${RESET}"
+  echo -e "${RED}║  ❌ PHASE 0 FAILED                                     ║${RESET}"
+  echo -e "${RED}╚════════════════════════════════════════════════════════╝${RESET}"
+  echo ""
+  echo "  Fix the issue, then re-run this script (finished blocks are kept)"
   exit 1
 fi
 
@@ -230,8 +337,7 @@ fi
 ARGOCD_PASSWORD=$(kubectl -n argocd get secret argocd-initial-admin-secret -o jsonpath="{.data.password}" 2>/dev/null | base64 -d || echo "N/A")
 
 # Success!
-END_TIME=$(date +%s)
-RUNTIME=$((END_TIME - START_TIME))
+RUNTIME=$((TOTAL_MS / 1000))
 RUNTIME_MIN=$((RUNTIME / 60))
 RUNTIME_SEC=$((RUNTIME % 60))
 
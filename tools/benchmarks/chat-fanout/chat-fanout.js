@@ -0,0 +1,155 @@
+// k6 load harness: canned chat fan-out (ADR-0005)
+//
+// One VU per project room; each VU opens SOCKETS_PER_ROOM WebSockets to its room and
+// sends bursts of canned actions. Every received frame records publish → delivery latency.
+//
+// Users: ADR-0005 allows max 3 sockets per user per project, so sockets are spread over
+// ceil(SOCKETS_PER_ROOM / 3) guest users that join every room. Actions rotate over enough
+// users to stay below 5 actions/s/user (API Conventions §6), and setup() paces sign-ins and
+// project creation to their limits. All three scale with RATE_LIMIT_SCALE, which must match
+// the backend's setting - at 1 the defaults need hundreds of users and a very long setup.
+//
+// Actions are sent with http.asyncRequest, so a burst never blocks the VU's event loop and
+// onmessage timestamps are taken when the frame arrives. Non-2xx actions (e.g. 429) are
+// counted in chat_action_errors and fail the run above 1%.
+
+import http from 'k6/http';
+import { check, sleep } from 'k6';
+import { Counter, Rate, Trend } from 'k6/metrics';
+import { setInterval, setTimeout, clearInterval } from 'k6/timers';
+import { WebSocket } from 'k6/experimental/websockets';
+
+const BASE_URL = __ENV.BASE_URL || 'http://api.localhost';
+const WS_URL = BASE_URL.replace(/^http/, 'ws');
+const ROOMS = parseInt(__ENV.ROOMS || '500');
+const SOCKETS_PER_ROOM = parseInt(__ENV.SOCKETS_PER_ROOM || '100');
+const DURATION_S = parseInt(__ENV.DURATION || '60');
+const BURST_SIZE = parseInt(__ENV.BURST_SIZE || '10');
+const BURST_INTERVAL_MS = parseInt(__ENV.BURST_INTERVAL_MS || '2000');
+const RATE_LIMIT_SCALE = parseFloat(__ENV.RATE_LIMIT_SCALE || '1');
+const ACTIONS = ['👍', '👎', 'Ready', 'Blocked', 'In Review', 'Deployed', 'Tests Green', 'Rollback'];
+
+const deliveryMs = new Trend('chat_delivery_ms', true);
+const framesReceived = new Counter('chat_frames_received');
+const actionsCoalesced = new Counter('chat_actions_coalesced');
+const socketsOpened = new Counter('chat_sockets_opened');
+const socketsClosedByServer = new Counter('chat_sockets_closed_by_server');
+const actionErrors = new Rate('chat_action_errors');
+
+// API Conventions §6 limits, scaled like the backend
+const SIGNIN_PER_MIN = 10 * RATE_LIMIT_SCALE; // Per IP: the whole setup() comes from one IP
+const REQUESTS_PER_MIN = 100 * RATE_LIMIT_SCALE; // Per user: project creation by the owner
+const ACTIONS_PER_S = 5 * RATE_LIMIT_SCALE; // Per user
+const ACTION_RATE = (ROOMS * BURST_SIZE * 1000) / BURST_INTERVAL_MS;
+const SOCKET_USERS = Math.ceil(SOCKETS_PER_ROOM / 3);
+const ACTION_USERS = Math.ceil(ACTION_RATE / (0.8 * ACTIONS_PER_S)); // 20% headroom for burst jitter
+
+export const options = {
+  setupTimeout: '10m',
+  scenarios: {
+    rooms: {
+      executor: 'per-vu-iterations',
+      vus: ROOMS,
+      iterations: 1,
+      maxDuration: `${DURATION_S + 120}s`,
+    },
+  },
+  thresholds: {
+    chat_delivery_ms: ['p(99)<1000'], // ADR-0005 HighChatLatency alert uses P95 > 1s
+    chat_action_errors: ['rate<0.01'], // More than 1% rejected actions invalidates the latencies
+  },
+};
+
+function signIn() {
+  const res = http.post(`${BASE_URL}/api/auth/signin`);
+  check(res, { 'guest sign-in 200': (r) => r.status === 200 });
+  return res.json('access_token');
+}
+
+function authHeaders(token) {
+  return { headers: { Authorization: `Bearer ${token}`, 'Content-Type': 'application/json' } };
+}
+
+export function setup() {
+  const users = [];
+  for (let i = 0; i < Math.max(SOCKET_USERS, ACTION_USERS); i++) {
+    users.push(signIn());
+    sleep(60 / SIGNIN_PER_MIN); // Stay below the sign-in limit per IP
+  }
+
+  const owner = users[0];
+  const org = http.post(`${BASE_URL}/api/organizations`,
+    JSON.stringify({ name: `bench-chat-${Date.now()}` }), authHeaders(owner));
+  check(org, { 'organization created': (r) => r.status === 201 });
+
+  const projects = [];
+  for (let i = 0; i < ROOMS; i++) {
+    const res = http.post(`${BASE_URL}/api/organizations/${org.json('org_id')}/projects`,
+      JSON.stringify({ name: `room-${i}` }), authHeaders(owner));
+    check(res, { 'project created': (r) => r.status === 201 });
+    projects.push(res.json('project_id'));
+    sleep(60 / REQUESTS_PER_MIN); // Stay below the owner's per-user limit
+  }
+  return { users, projects };
+}
+
+// Frames are ASCII JSON (non-ASCII actions are \u-escaped by the hub)
+function decode(data) {
+  return typeof data === 'string' ? data : String.fromCharCode.apply(null, new Uint8Array(data));
+}
+
+export default function (data) {
+  const projectId = data.projects[(__VU - 1) % data.projects.length];
+  const sockets = [];
+  let opened = 0;
+  let burstTimer = null;
+  let sent = 0;
+
+  const sendBurst = () => {
+    const action = ACTIONS[Math.floor(Math.random() * ACTIONS.length)];
+    for (let i = 0; i < BURST_SIZE; i++) {
+      // Rotate senders across VUs so every user gets an equal share of ACTION_RATE
+      const token = data.users[((__VU - 1) * BURST_SIZE + sent++) % data.users.length];
+      http.asyncRequest('POST', `${BASE_URL}/api/projects/${projectId}/chat/actions`,
+        JSON.stringify({ action }), authHeaders(token))
+        .then((res) => {
+          actionErrors.add(!check(res, { 'chat action accepted': (r) => r.status >= 200 && r.status < 300 }));
+        });
+    }
+  };
+
+  for (let i = 0; i < SOCKETS_PER_ROOM; i++) {
+    const token = data.users[i % data.users.length];
+    const ws = new WebSocket(`${WS_URL}/ws/projects/${projectId}/chat?token=${token}`);
+    ws.binaryType = 'arraybuffer';
+
+    ws.onopen = () => {
+      socketsOpened.add(1);
+      opened += 1;
+      if (opened === SOCKETS_PER_ROOM) {
+        burstTimer = setInterval(sendBurst, BURST_INTERVAL_MS);
+      }
+    };
+    ws.onmessage = (event) => {
+      const frame = JSON.parse(decode(event.data));
+      deliveryMs.add(Date.now() - frame.ts);
+      framesReceived.add(1);
+      if (i === 0 && frame.count > 1) {
+        actionsCoalesced.add(frame.count - 1); // Count once per room, not once per socket
+      }
+    };
+    ws.onclose = (event) => {
+      if (event && event.code === 1013) {
+        socketsClosedByServer.add(1);
+      }
+    };
+    sockets.push(ws);
+  }
+
+  setTimeout(() => {
+    if (burstTimer !== null) {
+      clearInterval(burstTimer);
+    }
+    sockets.forEach((ws) => ws.close());
+  }, DURATION_S * 1000);
+}
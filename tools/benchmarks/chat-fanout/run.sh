@@ -0,0 +1,134 @@
+#!/bin/bash
+################################################################################
+# 📈 Benchmark: Canned Chat Fan-Out (50k WebSockets)
+#
+# Purpose: Load harness for the ADR-0005 sharded fan-out hub - opens ROOMS ×
+#          SOCKETS_PER_ROOM WebSockets, sends bursty canned actions and reports
+#          publish → delivery latency percentiles
+# Runtime: ~3 minutes (setup + DURATION)
+#
+# Requirements:
+#   - Backend API reachable at BASE_URL (Phase 2+), started with RATE_LIMIT_SCALE
+#     raised (API Conventions §6); pass the same value here. The harness sizes its
+#     guest users and setup pacing to the scaled limits (10 sign-ins/min/IP,
+#     5 actions/s/user, 100 req/min/user) and refuses to run if setup would not
+#     fit the 10 min setupTimeout
+#   - k6 >= 0.46 (https://k6.io/docs/get-started/installation/)
+#   - File descriptors and ephemeral ports for 50k client sockets (checked below)
+#
+# Metrics (k6 summary):
+#   chat_delivery_ms               p50 / p95 / p99 / max delivery latency
+#   chat_frames_received           frames delivered to all sockets
+#   chat_actions_coalesced         actions merged into aggregated frames
+#   chat_sockets_closed_by_server  slow consumers closed with 1013
+#   chat_action_errors             share of non-2xx action POSTs (threshold < 1%)
+#
+# Environment:
+#   RATE_LIMIT_SCALE (required, e.g. 1000)
+#   BASE_URL=http://api.localhost  ROOMS=500  SOCKETS_PER_ROOM=100  DURATION=60
+#   BURST_SIZE=10  BURST_INTERVAL_MS=2000
+#
+# Usage:
+#   ./tools/benchmarks/chat-fanout/run.sh
+################################################################################
+
+set -euo pipefail
+
+# Color codes
+RESET='\033[0m'
+GREEN='\033[0;32m'
+CYAN='\033[0;36m'
+YELLOW='\033[1;33m'
+
+BASE_URL="${BASE_URL:-http://api.localhost}"
+RATE_LIMIT_SCALE="${RATE_LIMIT_SCALE:-}"
+ROOMS="${ROOMS:-500}"
+SOCKETS_PER_ROOM="${SOCKETS_PER_ROOM:-100}"
+DURATION="${DURATION:-60}"
+BURST_SIZE="${BURST_SIZE:-10}"
+BURST_INTERVAL_MS="${BURST_INTERVAL_MS:-2000}"
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+SOCKETS=$(( ROOMS * SOCKETS_PER_ROOM ))
+
+log_info() {
+  echo -e "${CYAN}➜ $1${RESET}"
+}
+
+log_success() {
+  echo -e "${GREEN}✓ $1${RESET}"
+}
+
+log_warning() {
+  echo -e "${YELLOW}⚠ $1${RESET}"
+}
+
+echo -e "${CYAN}╔════════════════════════════════════════════════════════╗${RESET}"
+echo -e "${CYAN}║  📈 Benchmark: Chat Fan-Out                           ║${RESET}"
+echo -e "${CYAN}╚════════════════════════════════════════════════════════╝${RESET}"
+echo ""
+
+if ! command -v k6 >/dev/null 2>&1; then
+  log_warning "k6 not found"
+  echo "  Install: https://k6.io/docs/get-started/installation/"
+  exit 1
+fi
+
+if [ -z "$RATE_LIMIT_SCALE" ]; then
+  log_warning "RATE_LIMIT_SCALE is not set"
+  echo "  Start the backend with RATE_LIMIT_SCALE=1000 (API Conventions §6) and pass the same value here"
+  exit 1
+fi
+
+# setup() signs in max(socket users, action users) guests at the sign-in limit and creates
+# ROOMS projects at the owner's per-user limit; k6 aborts setup after 10 minutes
+setup_s=$(awk -v rooms="$ROOMS" -v spr="$SOCKETS_PER_ROOM" -v burst="$BURST_SIZE" \
+              -v interval="$BURST_INTERVAL_MS" -v scale="$RATE_LIMIT_SCALE" '
+  function ceil(x) { return (x == int(x)) ? x : int(x) + 1 }
+  BEGIN {
+    socket_users = ceil(spr / 3)
+    action_users = ceil(rooms * burst * 1000 / interval / (0.8 * 5 * scale))
+    users = (socket_users > action_users) ? socket_users : action_users
+    printf "%d", users * 60 / (10 * scale) + rooms * 60 / (100 * scale)
+  }')
+if [ "$setup_s" -gt 600 ]; then
+  log_warning "Setup would take ~${setup_s}s at RATE_LIMIT_SCALE=$RATE_LIMIT_SCALE (limit 600s)"
+  echo "  Raise RATE_LIMIT_SCALE on the backend (and here), or reduce ROOMS/BURST_SIZE"
+  exit 1
+fi
+
+if ! curl -sf "${BASE_URL}/health" >/dev/null; then
+  log_warning "Backend API not reachable at ${BASE_URL}/health"
+  echo "  Deploy the backend (Phase 2) or set BASE_URL"
+  exit 1
+fi
+
+# Each client socket needs one file descriptor and one ephemeral port
+log_info "Checking client limits for $SOCKETS sockets..."
+if [ "$(ulimit -n)" != "unlimited" ] && [ "$(ulimit -n)" -lt $(( SOCKETS + 1024 )) ]; then
+  ulimit -n $(( SOCKETS + 1024 )) 2>/dev/null || {
+    log_warning "ulimit -n is $(ulimit -n), need $(( SOCKETS + 1024 ))"
+    echo "  Raise it: ulimit -n $(( SOCKETS + 1024 ))  (or reduce ROOMS/SOCKETS_PER_ROOM)"
+    exit 1
+  }
+fi
+read -r port_low port_high < /proc/sys/net/ipv4/ip_local_port_range
+if [ $(( port_high - port_low )) -lt "$SOCKETS" ]; then
+  log_warning "Ephemeral port range $port_low-$port_high is smaller than $SOCKETS sockets"
+  echo "  Widen it: sudo sysctl -w net.ipv4.ip_local_port_range=\"1024 65535\""
+  exit 1
+fi
+log_success "Client limits OK"
+
+log_info "Running k6 ($ROOMS rooms × $SOCKETS_PER_ROOM sockets, ${DURATION}s)..."
+k6 run \
+  --summary-trend-stats "p(50),p(95),p(99),max" \
+  -e BASE_URL="$BASE_URL" \
+  -e RATE_LIMIT_SCALE="$RATE_LIMIT_SCALE" \
+  -e ROOMS="$ROOMS" \
+  -e SOCKETS_PER_ROOM="$SOCKETS_PER_ROOM" \
+  -e DURATION="$DURATION" \
+  -e BURST_SIZE="$BURST_SIZE" \
+  -e BURST_INTERVAL_MS="$BURST_INTERVAL_MS" \
+  "$SCRIPT_DIR/chat-fanout.js"
+log_success "Chat fan-out benchmark complete"
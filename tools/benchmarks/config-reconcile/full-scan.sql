@@ -0,0 +1,2 @@
+-- One pod reconcile, old mode: read every config version (ADR-0002 before the change feed)
+SELECT key, version FROM bench_reconcile.service_configs;
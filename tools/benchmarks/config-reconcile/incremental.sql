@@ -0,0 +1,14 @@
+-- One pod reconcile, change-feed mode: one page after the pod's watermark + the 30s re-read window
+-- (two queries, as in ADR-0002). The watermark is simulated as "newest id minus the changes of one poll interval".
+SELECT h.id, c.org_id, c.service, c.key, h.version
+FROM bench_reconcile.config_history h
+JOIN bench_reconcile.service_configs c ON c.id = h.config_id
+WHERE h.id > (SELECT MAX(id) FROM bench_reconcile.config_history) - :changes_per_poll
+ORDER BY h.id
+LIMIT 1000;
+
+SELECT c.org_id, c.service, c.key, h.version
+FROM bench_reconcile.config_history h
+JOIN bench_reconcile.service_configs c ON c.id = h.config_id
+WHERE h.changed_at > NOW() - INTERVAL '30 seconds'
+  AND h.id <= (SELECT MAX(id) FROM bench_reconcile.config_history) - :changes_per_poll;
@@ -0,0 +1,127 @@
+#!/bin/bash
+################################################################################
+# 📈 Benchmark: Config Reconcile (Full Scan vs. Change Feed)
+#
+# Purpose: Compares the ADR-0002 reconcile fallback modes against the local
+#          PostgreSQL from Phase 0 (Block 6)
+# Runtime: ~2 minutes (seed ~20s + 2 × DURATION)
+#
+# Scenario:
+#   - CONFIGS service_configs rows (default 100k = 100 orgs × 1000 keys)
+#   - PODS concurrent pgbench clients, each transaction = one pod reconcile
+#   - One background writer changing CHANGES_PER_POLL configs per 5s interval
+#
+# Modes:
+#   full-scan    SELECT key, version FROM service_configs        (every 10 min)
+#   incremental  one id > watermark page + 30 s re-read query   (every 5 s)
+#
+# Environment:
+#   CONFIGS=100000  PODS=50  DURATION=30  CHANGES_PER_POLL=20  KEEP_DATA=0
+#
+# Usage:
+#   ./tools/benchmarks/config-reconcile/run.sh
+################################################################################
+
+set -euo pipefail
+
+# Color codes
+RESET='\033[0m'
+GREEN='\033[0;32m'
+CYAN='\033[0;36m'
+YELLOW='\033[1;33m'
+
+NAMESPACE="demo-platform"
+PG_POD="postgresql-0"
+PG_ENV="PGPASSWORD=demopass"
+PG_ARGS="-U demouser -d demodb"
+
+CONFIGS="${CONFIGS:-100000}"
+PODS="${PODS:-50}"
+DURATION="${DURATION:-30}"
+CHANGES_PER_POLL="${CHANGES_PER_POLL:-20}"
+KEEP_DATA="${KEEP_DATA:-0}"
+
+# Reconcile intervals per mode (seconds) - see ADR-0002 "Reconcile Loop (Change Feed)"
+FULL_SCAN_INTERVAL=600
+INCREMENTAL_INTERVAL=5
+WRITER_RATE=$(( (CHANGES_PER_POLL + INCREMENTAL_INTERVAL - 1) / INCREMENTAL_INTERVAL ))
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+
+log_info() {
+  echo -e "${CYAN}➜ $1${RESET}"
+}
+
+log_success() {
+  echo -e "${GREEN}✓ $1${RESET}"
+}
+
+log_warning() {
+  echo -e "${YELLOW}⚠ $1${RESET}"
+}
+
+# Copy a local file into the PostgreSQL pod (no tar/kubectl cp dependency)
+copy_to_pod() {
+  kubectl exec -i -n "$NAMESPACE" "$PG_POD" -- sh -c "cat > /tmp/$(basename "$1")" < "$1"
+}
+
+# Run one pgbench mode with the background writer; prints "<latency_ms> <tps>"
+run_mode() {
+  local script="$1"
+  kubectl exec -n "$NAMESPACE" "$PG_POD" -- env "$PG_ENV" sh -c "
+    pgbench -n $PG_ARGS -c 1 -R $WRITER_RATE -T $DURATION -D configs=$CONFIGS \
+      -f /tmp/writer.sql > /tmp/writer.log 2>&1 &
+    pgbench -n $PG_ARGS -c $PODS -j 4 -T $DURATION -D changes_per_poll=$CHANGES_PER_POLL \
+      -f /tmp/$script 2>&1
+    wait
+  " | awk '/latency average/ {lat=$4} /^tps/ {tps=$3} END {print lat, tps}'
+}
+
+echo -e "${CYAN}╔════════════════════════════════════════════════════════╗${RESET}"
+echo -e "${CYAN}║  📈 Benchmark: Config Reconcile                       ║${RESET}"
+echo -e "${CYAN}╚════════════════════════════════════════════════════════╝${RESET}"
+echo ""
+
+if ! kubectl get pod -n "$NAMESPACE" "$PG_POD" >/dev/null 2>&1; then
+  log_warning "PostgreSQL pod '$PG_POD' not found in namespace '$NAMESPACE'"
+  echo "  Run Phase 0 Block 6 first: ./setup-template/phase0-template-foundation/06-deploy-databases/deploy.sh"
+  exit 1
+fi
+
+log_info "Copying benchmark scripts into $PG_POD..."
+for file in seed.sql full-scan.sql incremental.sql writer.sql; do
+  copy_to_pod "$SCRIPT_DIR/$file"
+done
+log_success "Scripts copied"
+
+log_info "Seeding $CONFIGS configs (schema bench_reconcile)..."
+kubectl exec -n "$NAMESPACE" "$PG_POD" -- env "$PG_ENV" psql $PG_ARGS -q -v ON_ERROR_STOP=1 \
+  -v orgs=$(( CONFIGS / 1000 )) -v keys_per_org=1000 -f /tmp/seed.sql >/dev/null
+log_success "Seed complete"
+
+log_info "Running full-scan reconcile ($PODS pods, ${DURATION}s)..."
+read -r full_latency full_tps <<< "$(run_mode full-scan.sql)"
+log_success "full-scan: ${full_latency} ms/reconcile, ${full_tps} reconciles/s"
+
+log_info "Running incremental reconcile ($PODS pods, ${DURATION}s)..."
+read -r incr_latency incr_tps <<< "$(run_mode incremental.sql)"
+log_success "incremental: ${incr_latency} ms/reconcile, ${incr_tps} reconciles/s"
+
+if [ "$KEEP_DATA" != "1" ]; then
+  kubectl exec -n "$NAMESPACE" "$PG_POD" -- env "$PG_ENV" psql $PG_ARGS -q \
+    -c "DROP SCHEMA IF EXISTS bench_reconcile CASCADE;" >/dev/null
+  log_success "Benchmark schema dropped (KEEP_DATA=1 to keep it)"
+fi
+
+# DB time spent per minute by all pods at each mode's reconcile interval
+awk -v pods="$PODS" \
+    -v fl="$full_latency" -v fi="$FULL_SCAN_INTERVAL" \
+    -v il="$incr_latency" -v ii="$INCREMENTAL_INTERVAL" '
+  BEGIN {
+    full_cost = pods * (60 / fi) * fl
+    incr_cost = pods * (60 / ii) * il
+    printf "\n%-12s %14s %10s %22s\n", "Mode", "ms/reconcile", "interval", "DB ms/min (all pods)"
+    printf "%-12s %14.2f %9ss %22.1f\n", "full-scan", fl, fi, full_cost
+    printf "%-12s %14.2f %9ss %22.1f\n", "incremental", il, ii, incr_cost
+    printf "\nPer-reconcile speed-up: %.0fx\n\n", fl / il
+  }'
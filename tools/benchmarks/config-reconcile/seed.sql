@@ -0,0 +1,58 @@
+-- Seed data for the config reconcile benchmark (ADR-0001 schema, isolated in its own schema)
+-- Variables: :orgs (organizations), :keys_per_org (configs per organization)
+
+DROP SCHEMA IF EXISTS bench_reconcile CASCADE;
+CREATE SCHEMA bench_reconcile;
+SET search_path TO bench_reconcile;
+
+-- Org IDs are md5('org-N')::uuid, like the tenant-pool seed (UUID org_id, ADR-0001)
+CREATE TABLE organizations (
+    org_id UUID PRIMARY KEY,
+    name VARCHAR(100) NOT NULL
+);
+
+CREATE TABLE service_configs (
+    id SERIAL PRIMARY KEY,
+    org_id UUID NOT NULL REFERENCES organizations(org_id),
+    service VARCHAR(50) NOT NULL,
+    key VARCHAR(100) NOT NULL,
+    value TEXT NOT NULL,
+    version INT NOT NULL DEFAULT 1,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    UNIQUE (org_id, service, key)
+);
+
+CREATE TABLE config_history (
+    id BIGSERIAL PRIMARY KEY,
+    config_id INT NOT NULL REFERENCES service_configs(id),
+    version INT NOT NULL,
+    old_value TEXT,
+    new_value TEXT NOT NULL,
+    changed_by VARCHAR(255) NOT NULL,
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    reason TEXT
+);
+
+INSERT INTO organizations (org_id, name)
+SELECT md5('org-' || o)::uuid, 'org-' || o FROM generate_series(1, :orgs) AS o;
+
+-- 4 services per org, keys_per_org / 4 keys per service
+INSERT INTO service_configs (org_id, service, key, value)
+SELECT md5('org-' || o)::uuid, s.service, 'key_' || k, md5(o::text || s.service || k)
+FROM generate_series(1, :orgs) AS o
+CROSS JOIN (VALUES ('ai'), ('email'), ('api'), ('features')) AS s(service)
+CROSS JOIN generate_series(1, :keys_per_org / 4) AS k;
+
+-- Initial history row per config, backdated so it sits outside the change-feed re-read window
+INSERT INTO config_history (config_id, version, new_value, changed_by, changed_at)
+SELECT id, version, value, 'seed', NOW() - INTERVAL '1 day'
+FROM service_configs
+ORDER BY id;
+
+CREATE INDEX idx_config_history_lookup ON config_history(config_id, changed_at DESC);
+CREATE INDEX idx_config_history_changed_at ON config_history(changed_at);
+
+ANALYZE organizations, service_configs, config_history;
+
+SELECT COUNT(*) AS configs FROM service_configs;
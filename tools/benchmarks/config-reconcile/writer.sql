@@ -0,0 +1,9 @@
+-- Concurrent config writer: one config change = UPDATE + change-feed row in one transaction
+\set config_id random(1, :configs)
+BEGIN;
+UPDATE bench_reconcile.service_configs
+   SET value = md5(random()::text), version = version + 1, updated_at = NOW()
+ WHERE id = :config_id;
+INSERT INTO bench_reconcile.config_history (config_id, version, new_value, changed_by)
+SELECT id, version, value, 'bench-writer' FROM bench_reconcile.service_configs WHERE id = :config_id;
+COMMIT;
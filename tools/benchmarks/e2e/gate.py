@@ -0,0 +1,149 @@
+"""Result collector and regression gate for the end-to-end benchmark suite.
+
+collect: merges the k6 summaries and propagation.json of one run directory into results.json
+compare: checks results.json against the SLO budgets (slos.json) and a baseline results.json
+
+Every metric is lower-is-better. A metric regresses when it is more than --threshold (relative) AND more than the
+unit's noise floor (absolute) above the baseline. Invoked by run.sh; standard library only.
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+SCHEMA = 1
+
+# k6 summary file → {k6 metric → suite metric prefix}; trend stats come from --summary-trend-stats
+K6_TRENDS = {
+    "hotpath.json": {"signin_ms": "signin", "read_ms": "reads", "ready_ms": "ready"},
+    "chat.json": {"chat_delivery_ms": "chat"},
+}
+K6_COUNTS = {
+    "hotpath.json": {"hotpath_rate_limited": "hotpath.rate_limited", "dropped_iterations": "hotpath.dropped_iterations"},
+    "chat.json": {"chat_sockets_closed_by_server": "chat.sockets_closed"},
+}
+K6_RATES = {
+    "hotpath.json": {"hotpath_errors": "hotpath.error_rate"},
+    "chat.json": {"chat_action_errors": "chat.action_error_rate"},
+}
+TREND_STATS = {"p(50)": "p50_ms", "p(95)": "p95_ms", "p(99)": "p99_ms"}
+
+
+def collect(run_dir: str, profile: str, params: list[str]) -> dict:
+    metrics: dict[str, dict] = {}
+    for filename, trends in K6_TRENDS.items():
+        path = os.path.join(run_dir, filename)
+        if not os.path.exists(path):
+            continue  # Scenario not selected
+        with open(path) as f:
+            summary = json.load(f)["metrics"]
+        for k6_name, prefix in trends.items():
+            for stat, suffix in TREND_STATS.items():
+                if k6_name in summary and stat in summary[k6_name]:
+                    metrics[f"{prefix}.{suffix}"] = {"value": summary[k6_name][stat], "unit": "ms"}
+        for k6_name, name in K6_COUNTS.get(filename, {}).items():
+            metrics[name] = {"value": summary.get(k6_name, {}).get("count", 0), "unit": "count"}
+        for k6_name, name in K6_RATES.get(filename, {}).items():
+            if k6_name in summary:
+                metrics[name] = {"value": summary[k6_name]["value"], "unit": "ratio"}
+
+    path = os.path.join(run_dir, "propagation.json")
+    if os.path.exists(path):
+        with open(path) as f:
+            metrics.update(json.load(f))
+
+    return {
+        "schema": SCHEMA,
+        "run_id": os.path.basename(os.path.normpath(run_dir)),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_rev": os.environ.get("GIT_REV", ""),
+        "profile": profile,
+        "params": dict(param.split("=", 1) for param in params),
+        "metrics": dict(sorted(metrics.items())),
+    }
+
+
+def compare(results: dict, baseline: dict | None, slos: dict, threshold: float, min_delta: dict) -> bool:
+    if baseline and baseline.get("params") != results["params"]:
+        changed = sorted(
+            k for k in results["params"].keys() | baseline["params"].keys()
+            if results["params"].get(k) != baseline["params"].get(k)
+        )
+        print(f"⚠ Parameters differ from the baseline ({', '.join(changed)}) - deltas are not comparable")
+
+    ok = True
+    print(f"\n  {'Metric':<28} {'Baseline':>10} {'Current':>10} {'Δ':>8} {'SLO':>8}  Status")
+    for name, metric in results["metrics"].items():
+        value, unit = metric["value"], metric["unit"]
+        previous = (baseline or {}).get("metrics", {}).get(name, {}).get("value")
+        budget = slos.get(name, {}).get("max")
+
+        status = "ok"
+        if budget is not None and value > budget:
+            status, ok = "SLO", False
+        elif previous is not None and value > previous * (1 + threshold) and value - previous > min_delta[unit]:
+            status, ok = "REGRESSED", False
+        elif previous is None:
+            status = "new"
+
+        delta = f"{(value - previous) / previous:+.0%}" if previous else "-"
+        print(
+            f"  {name:<28} {fmt(previous):>10} {fmt(value):>10} {delta:>8} {fmt(budget):>8}  "
+            f"{'✓ ' if status in ('ok', 'new') else '✗ '}{status}"
+        )
+    print()
+    return ok
+
+
+def fmt(value) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.4f}" if value < 1 else f"{value:.1f}"
+    return str(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_collect = sub.add_parser("collect")
+    p_collect.add_argument("--run-dir", required=True)
+    p_collect.add_argument("--profile", required=True)
+    p_collect.add_argument("--param", action="append", default=[], help="KEY=VALUE recorded with the run (repeat)")
+
+    p_compare = sub.add_parser("compare")
+    p_compare.add_argument("--results", required=True)
+    p_compare.add_argument("--baseline", help="Baseline results.json (skipped if missing)")
+    p_compare.add_argument("--slos", required=True)
+    p_compare.add_argument("--threshold", type=float, default=0.15, help="Relative regression threshold")
+    p_compare.add_argument("--min-delta-ms", type=float, default=2.0, help="Noise floor for latency metrics")
+    args = parser.parse_args()
+
+    if args.command == "collect":
+        results = collect(args.run_dir, args.profile, args.param)
+        with open(os.path.join(args.run_dir, "results.json"), "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        return
+
+    with open(args.results) as f:
+        results = json.load(f)
+    with open(args.slos) as f:
+        slos = json.load(f)
+    baseline = None
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"Baseline: {args.baseline} (run {baseline['run_id']}, {baseline.get('git_rev') or 'unknown rev'})")
+    else:
+        print("No baseline for this profile - checking SLO budgets only (UPDATE_BASELINE=1 records one)")
+
+    min_delta = {"ms": args.min_delta_ms, "ratio": 0.005, "count": 0}
+    sys.exit(0 if compare(results, baseline, slos, args.threshold, min_delta) else 1)
+
+
+if __name__ == "__main__":
+    main()
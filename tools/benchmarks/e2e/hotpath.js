@@ -0,0 +1,117 @@
+// k6 load harness: platform hot paths (guest sign-in, authenticated reads, /health/ready)
+//
+// All scenarios run at the same time at a fixed arrival rate, so latencies are measured
+// under mixed load and stay comparable between runs (k6 reports dropped_iterations when
+// the backend cannot keep up instead of silently lowering the rate).
+//
+// Users: setup() signs in USERS guests; each creates its own organization with one project,
+// so the per-user (100/min) and per-org (1000/min) limits spread over many keys. The backend
+// must run with RATE_LIMIT_SCALE raised (API Conventions §6) - 429s count as errors here.
+
+import http from 'k6/http';
+import { check } from 'k6';
+import { Counter, Rate, Trend } from 'k6/metrics';
+
+const BASE_URL = __ENV.BASE_URL || 'http://api.localhost';
+const SCENARIOS = (__ENV.SCENARIOS || 'signin,reads,ready').split(',');
+const DURATION_S = parseInt(__ENV.DURATION || '60');
+const SIGNIN_RATE = parseInt(__ENV.SIGNIN_RATE || '20');
+const READ_RATE = parseInt(__ENV.READ_RATE || '200');
+const READY_RATE = parseInt(__ENV.READY_RATE || '20');
+const USERS = parseInt(__ENV.USERS || '20');
+const CONFIG_KEY = __ENV.CONFIG_KEY || 'ai.threshold';
+
+const signinMs = new Trend('signin_ms', true);
+const readMs = new Trend('read_ms', true);
+const readyMs = new Trend('ready_ms', true);
+const errors = new Rate('hotpath_errors');
+const rateLimited = new Counter('hotpath_rate_limited');
+
+function arrival(exec, rate) {
+  return {
+    executor: 'constant-arrival-rate',
+    exec,
+    rate,
+    timeUnit: '1s',
+    duration: `${DURATION_S}s`,
+    preAllocatedVUs: Math.max(10, Math.ceil(rate / 10)),
+    maxVUs: Math.max(50, rate * 2),
+  };
+}
+
+const ALL_SCENARIOS = {
+  signin: arrival('signin', SIGNIN_RATE),
+  reads: arrival('reads', READ_RATE),
+  ready: arrival('ready', READY_RATE),
+};
+
+const scenarios = {};
+SCENARIOS.filter((name) => name in ALL_SCENARIOS).forEach((name) => {
+  scenarios[name] = ALL_SCENARIOS[name];
+});
+
+export const options = {
+  setupTimeout: '5m',
+  scenarios,
+};
+
+function record(res, trend, endpoint) {
+  trend.add(res.timings.duration, { endpoint });
+  errors.add(res.status !== 200, { endpoint });
+  if (res.status === 429) {
+    rateLimited.add(1, { endpoint });
+  }
+}
+
+function authHeaders(token) {
+  return { headers: { Authorization: `Bearer ${token}`, 'Content-Type': 'application/json' } };
+}
+
+export function setup() {
+  const users = [];
+  for (let i = 0; i < USERS; i++) {
+    const res = http.post(`${BASE_URL}/api/auth/signin`);
+    check(res, { 'guest sign-in 200': (r) => r.status === 200 });
+    const token = res.json('access_token');
+
+    const org = http.post(`${BASE_URL}/api/organizations`,
+      JSON.stringify({ name: `bench-e2e-${Date.now()}-${i}` }), authHeaders(token));
+    check(org, { 'organization created': (r) => r.status === 201 });
+    const project = http.post(`${BASE_URL}/api/organizations/${org.json('org_id')}/projects`,
+      JSON.stringify({ name: 'hot-path' }), authHeaders(token));
+    check(project, { 'project created': (r) => r.status === 201 });
+
+    users.push({ token, orgId: org.json('org_id'), projectId: project.json('project_id') });
+  }
+  return { users };
+}
+
+export function signin() {
+  record(http.post(`${BASE_URL}/api/auth/signin`, null, { tags: { endpoint: 'signin' } }), signinMs, 'signin');
+}
+
+// Read mix: 50% project get (ADR-0004 authenticated read path), 30% project list, 20% config get.
+// Every request pays JWT verification, the denylist check and the rate-limit check.
+export function reads(data) {
+  const user = data.users[Math.floor(Math.random() * data.users.length)];
+  const params = authHeaders(user.token);
+  const roll = Math.random();
+  let endpoint;
+  let url;
+  if (roll < 0.5) {
+    endpoint = 'project_get';
+    url = `${BASE_URL}/api/projects/${user.projectId}`;
+  } else if (roll < 0.8) {
+    endpoint = 'project_list';
+    url = `${BASE_URL}/api/organizations/${user.orgId}/projects?limit=20`;
+  } else {
+    endpoint = 'config_get';
+    url = `${BASE_URL}/api/configs/${encodeURIComponent(CONFIG_KEY)}`;
+  }
+  params.tags = { endpoint };
+  record(http.get(url, params), readMs, endpoint);
+}
+
+export function ready() {
+  record(http.get(`${BASE_URL}/health/ready`, { tags: { endpoint: 'ready' } }), readyMs, 'ready');
+}
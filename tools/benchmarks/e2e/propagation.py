@@ -0,0 +1,141 @@
+"""Config propagation driver: PUT /api/configs/{key} → time until every replica serves the new version.
+
+Each sample re-writes the key's current value (the version still increments, the config does not change) and
+polls GET /api/configs/{key}/version (the version in the pod's snapshot, scoped to the guest's org) on every replica
+directly until all of them report the new version. The polls count against the guest's rate limit, so the backend
+must run with RATE_LIMIT_SCALE raised. Invoked by run.sh; standard library only.
+"""
+
+import argparse
+import http.client
+import json
+import sys
+import threading
+import time
+from urllib.parse import quote, urlsplit
+
+
+class Client:
+    """Keep-alive HTTP/1.1 connection to one base URL (one per thread)."""
+
+    def __init__(self, base_url: str, timeout: float = 5.0):
+        parts = urlsplit(base_url)
+        cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._conn = cls(parts.hostname, parts.port, timeout=timeout)
+
+    def request(self, method: str, path: str, body: dict | None = None, token: str | None = None) -> tuple[int, dict]:
+        headers = {}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        try:
+            self._conn.request(method, path, payload, headers)
+            response = self._conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            self._conn.close()  # Reconnect on the next request
+            raise
+        data = response.read()
+        return response.status, json.loads(data) if data else {}
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def wait_for_version(
+    client: Client, path: str, token: str, version: int, deadline: float, poll_s: float, seen: list, index: int
+):
+    while time.perf_counter() < deadline:
+        try:
+            status, body = client.request("GET", path, token=token)
+        except (http.client.HTTPException, OSError):
+            status, body = 0, {}
+        if status == 200 and body.get("version", 0) >= version:
+            seen[index] = time.perf_counter()
+            return
+        time.sleep(poll_s)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", required=True, help="API entry point for sign-in and the config PUT")
+    parser.add_argument("--replica", action="append", required=True, help="Base URL of one replica (repeat)")
+    parser.add_argument("--key", default="ai.threshold")
+    parser.add_argument("--samples", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.5, help="Seconds between samples")
+    parser.add_argument("--poll-ms", type=float, default=2.0)
+    parser.add_argument("--timeout", type=float, default=5.0, help="Seconds before a sample counts as timed out")
+    parser.add_argument("--output", required=True, help="JSON metrics file")
+    args = parser.parse_args()
+
+    api = Client(args.base_url)
+    status, body = api.request("POST", "/api/auth/signin")
+    if status != 200:
+        sys.exit(f"Guest sign-in failed: HTTP {status}")
+    token = body["access_token"]
+
+    path = f"/api/configs/{quote(args.key)}"
+    status, config = api.request("GET", path, token=token)
+    if status != 200:
+        sys.exit(f"GET {path} failed: HTTP {status} (the key must exist)")
+    value, version = config["value"], config["version"]
+
+    replicas = [Client(url) for url in args.replica]
+    all_pods_ms, per_pod_ms, timeouts = [], [], 0
+    for _ in range(args.samples):
+        version += 1
+        seen: list[float | None] = [None] * len(replicas)
+        started = time.perf_counter()
+        deadline = started + args.timeout
+        pollers = [
+            threading.Thread(
+                target=wait_for_version,
+                args=(client, f"{path}/version", token, version, deadline, args.poll_ms / 1000, seen, i),
+            )
+            for i, client in enumerate(replicas)
+        ]
+        for poller in pollers:
+            poller.start()
+        status, config = api.request("PUT", path, {"value": value}, token=token)
+        if status != 200:
+            sys.exit(f"PUT {path} failed: HTTP {status}")
+        if config["version"] != version:  # Another writer bumped the key; resync for the next sample
+            version = config["version"]
+        for poller in pollers:
+            poller.join()
+
+        if None in seen:
+            timeouts += 1
+        else:
+            per_pod_ms.extend((t - started) * 1000 for t in seen)
+            all_pods_ms.append((max(seen) - started) * 1000)
+        time.sleep(args.interval)
+
+    metrics = {
+        "propagation.p50_ms": {"value": percentile(all_pods_ms, 0.50), "unit": "ms"},
+        "propagation.p95_ms": {"value": percentile(all_pods_ms, 0.95), "unit": "ms"},
+        "propagation.p99_ms": {"value": percentile(all_pods_ms, 0.99), "unit": "ms"},
+        "propagation.max_ms": {"value": max(all_pods_ms, default=0.0), "unit": "ms"},
+        "propagation.pod_p50_ms": {"value": percentile(per_pod_ms, 0.50), "unit": "ms"},
+        "propagation.timeouts": {"value": timeouts, "unit": "count"},
+    }
+    with open(args.output, "w") as f:
+        json.dump(metrics, f, indent=2)
+
+    print(f"\n{'Replicas':>8} {'Samples':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'Timeouts':>8}")
+    print(
+        f"{len(replicas):>8} {len(all_pods_ms):>8} "
+        + " ".join(f"{metrics[f'propagation.{s}_ms']['value']:>8.1f}" for s in ("p50", "p95", "p99", "max"))
+        + f" {timeouts:>8}"
+    )
+    print(f"\nAll-pods time = PUT sent → last replica reports the version (resolution ~{args.poll_ms:g} ms + one poll)\n")
+
+
+if __name__ == "__main__":
+    main()
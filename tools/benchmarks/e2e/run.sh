@@ -0,0 +1,250 @@
+#!/bin/bash
+################################################################################
+# 📈 Benchmark: End-to-End Hot Paths + Regression Gate
+#
+# Purpose: Measures the platform API hot paths against the kind cluster (or
+#          local stand-ins), writes machine-readable results and fails when a
+#          metric breaks its ADR budget or regresses past THRESHOLD against the
+#          stored baseline of this PROFILE
+# Runtime: ~5 minutes (hot paths DURATION + chat DURATION + SAMPLES × 0.5s)
+#
+# Scenarios (SCENARIOS, comma-separated):
+#   signin       POST /api/auth/signin at SIGNIN_RATE/s              (ADR-0004)
+#   reads        Authenticated project/config reads at READ_RATE/s    (ADR-0004 JWT + denylist path)
+#   ready        GET /health/ready at READY_RATE/s                    (readiness probe cost)
+#   chat         Chat action → WebSocket delivery (../chat-fanout)    (ADR-0005)
+#   propagation  Config PUT → all REPLICAS pods report the version    (ADR-0002, <100ms)
+#   signin, reads and ready run concurrently (mixed load, fixed arrival rates)
+#
+# Requirements:
+#   - Backend API reachable at BASE_URL (Phase 2+), started with RATE_LIMIT_SCALE
+#     raised (API Conventions §6) so the load generator is not throttled
+#   - k6 >= 0.46, python3 (standard library only)
+#   - TARGET=kind: kubectl access; REPLICAS pods of BACKEND_DEPLOYMENT are
+#     port-forwarded for the propagation probe (the deployment is scaled for the
+#     run and restored afterwards)
+#   - TARGET=local: REPLICA_URLS lists the base URLs of the local backend replicas
+#
+# Output:
+#   results/<run-id>/results.json   Metrics (p50/p95/p99 per scenario, error rate,
+#                                   timeouts) with profile, params and git revision
+#   baselines/<PROFILE>.json        Baseline compared against (UPDATE_BASELINE=1 replaces it)
+#   Exit code 1 on an SLO breach (slos.json) or a regression
+#
+# Environment:
+#   BASE_URL=http://api.localhost  TARGET=kind  PROFILE=$TARGET  SCENARIOS=signin,reads,ready,chat,propagation
+#   RATE_LIMIT_SCALE=1000 (must match the backend)
+#   DURATION=60  SIGNIN_RATE=20  READ_RATE=200  READY_RATE=20  USERS=20  CONFIG_KEY=ai.threshold
+#   CHAT_ROOMS=50  CHAT_SOCKETS_PER_ROOM=20  REPLICAS=3  SAMPLES=50
+#   THRESHOLD=0.15  MIN_DELTA_MS=2  UPDATE_BASELINE=0
+#   BACKEND_NAMESPACE=demo-platform  BACKEND_DEPLOYMENT=backend  BACKEND_PORT=8000
+#   REPLICA_URLS="http://127.0.0.1:8001 http://127.0.0.1:8002"  (TARGET=local)
+#
+# Usage:
+#   ./tools/benchmarks/e2e/run.sh
+################################################################################
+
+set -euo pipefail
+
+# Color codes
+RESET='\033[0m'
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+CYAN='\033[0;36m'
+YELLOW='\033[1;33m'
+
+BASE_URL="${BASE_URL:-http://api.localhost}"
+RATE_LIMIT_SCALE="${RATE_LIMIT_SCALE:-1000}"
+TARGET="${TARGET:-kind}"
+PROFILE="${PROFILE:-$TARGET}"
+SCENARIOS="${SCENARIOS:-signin,reads,ready,chat,propagation}"
+DURATION="${DURATION:-60}"
+SIGNIN_RATE="${SIGNIN_RATE:-20}"
+READ_RATE="${READ_RATE:-200}"
+READY_RATE="${READY_RATE:-20}"
+USERS="${USERS:-20}"
+CONFIG_KEY="${CONFIG_KEY:-ai.threshold}"
+CHAT_ROOMS="${CHAT_ROOMS:-50}"
+CHAT_SOCKETS_PER_ROOM="${CHAT_SOCKETS_PER_ROOM:-20}"
+REPLICAS="${REPLICAS:-3}"
+SAMPLES="${SAMPLES:-50}"
+THRESHOLD="${THRESHOLD:-0.15}"
+MIN_DELTA_MS="${MIN_DELTA_MS:-2}"
+UPDATE_BASELINE="${UPDATE_BASELINE:-0}"
+BACKEND_NAMESPACE="${BACKEND_NAMESPACE:-demo-platform}"
+BACKEND_DEPLOYMENT="${BACKEND_DEPLOYMENT:-backend}"
+BACKEND_PORT="${BACKEND_PORT:-8000}"
+REPLICA_URLS="${REPLICA_URLS:-}"
+LOCAL_PORT_BASE=18000
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+RUN_ID="$(date -u +%Y%m%dT%H%M%SZ)"
+RUN_DIR="$SCRIPT_DIR/results/$RUN_ID"
+BASELINE="$SCRIPT_DIR/baselines/$PROFILE.json"
+
+log_info() {
+  echo -e "${CYAN}➜ $1${RESET}"
+}
+
+log_success() {
+  echo -e "${GREEN}✓ $1${RESET}"
+}
+
+log_warning() {
+  echo -e "${YELLOW}⚠ $1${RESET}"
+}
+
+has_scenario() {
+  [[ ",$SCENARIOS," == *",$1,"* ]]
+}
+
+echo -e "${CYAN}╔════════════════════════════════════════════════════════╗${RESET}"
+echo -e "${CYAN}║  📈 Benchmark: End-to-End Hot Paths                   ║${RESET}"
+echo -e "${CYAN}╚════════════════════════════════════════════════════════╝${RESET}"
+echo ""
+
+if ! command -v k6 >/dev/null 2>&1; then
+  log_warning "k6 not found"
+  echo "  Install: https://k6.io/docs/get-started/installation/"
+  exit 1
+fi
+
+if ! curl -sf "${BASE_URL}/health" >/dev/null; then
+  log_warning "Backend API not reachable at ${BASE_URL}/health"
+  echo "  Deploy the backend (Phase 2) or set BASE_URL"
+  exit 1
+fi
+
+if [ "$TARGET" = "local" ] && has_scenario propagation && [ -z "$REPLICA_URLS" ]; then
+  log_warning "TARGET=local needs REPLICA_URLS for the propagation scenario"
+  exit 1
+fi
+
+mkdir -p "$RUN_DIR"
+log_info "Run $RUN_ID (profile '$PROFILE', results in ${RUN_DIR#$SCRIPT_DIR/})"
+echo ""
+
+# Hot paths: sign-in, authenticated reads, readiness probe (one k6 run, mixed load)
+K6_SCENARIOS=$(echo "$SCENARIOS" | tr ',' '\n' | grep -E '^(signin|reads|ready)$' | paste -sd, - || true)
+if [ -n "$K6_SCENARIOS" ]; then
+  log_info "Hot paths [$K6_SCENARIOS] for ${DURATION}s..."
+  k6 run --quiet \
+    --summary-trend-stats "p(50),p(95),p(99),max" \
+    --summary-export "$RUN_DIR/hotpath.json" \
+    -e BASE_URL="$BASE_URL" \
+    -e SCENARIOS="$K6_SCENARIOS" \
+    -e DURATION="$DURATION" \
+    -e SIGNIN_RATE="$SIGNIN_RATE" \
+    -e READ_RATE="$READ_RATE" \
+    -e READY_RATE="$READY_RATE" \
+    -e USERS="$USERS" \
+    -e CONFIG_KEY="$CONFIG_KEY" \
+    "$SCRIPT_DIR/hotpath.js"
+  log_success "Hot paths complete"
+fi
+
+# Chat fan-out: reuses the ADR-0005 harness at suite scale; its own k6 threshold
+# (exit 99) is reported by the gate instead of aborting the suite
+if has_scenario chat; then
+  log_info "Chat fan-out ($CHAT_ROOMS rooms × $CHAT_SOCKETS_PER_ROOM sockets, ${DURATION}s)..."
+  rc=0
+  k6 run --quiet \
+    --summary-trend-stats "p(50),p(95),p(99),max" \
+    --summary-export "$RUN_DIR/chat.json" \
+    -e BASE_URL="$BASE_URL" \
+    -e RATE_LIMIT_SCALE="$RATE_LIMIT_SCALE" \
+    -e ROOMS="$CHAT_ROOMS" \
+    -e SOCKETS_PER_ROOM="$CHAT_SOCKETS_PER_ROOM" \
+    -e DURATION="$DURATION" \
+    "$SCRIPT_DIR/../chat-fanout/chat-fanout.js" || rc=$?
+  if [ "$rc" -ne 0 ] && [ "$rc" -ne 99 ]; then
+    log_warning "Chat fan-out failed (k6 exit $rc)"
+    exit 1
+  fi
+  log_success "Chat fan-out complete"
+fi
+
+# Config propagation: PUT through BASE_URL, poll /api/configs/{key}/version on every replica directly
+if has_scenario propagation; then
+  REPLICA_ARGS=()
+  if [ "$TARGET" = "kind" ]; then
+    ORIGINAL_REPLICAS=$(kubectl get deployment "$BACKEND_DEPLOYMENT" -n "$BACKEND_NAMESPACE" -o jsonpath='{.spec.replicas}')
+    PF_PIDS=()
+    cleanup() {
+      kill "${PF_PIDS[@]}" 2>/dev/null || true
+      if [ "$ORIGINAL_REPLICAS" != "$REPLICAS" ]; then
+        kubectl scale deployment "$BACKEND_DEPLOYMENT" -n "$BACKEND_NAMESPACE" --replicas="$ORIGINAL_REPLICAS" >/dev/null
+      fi
+    }
+    trap cleanup EXIT
+
+    if [ "$ORIGINAL_REPLICAS" != "$REPLICAS" ]; then
+      log_info "Scaling $BACKEND_DEPLOYMENT from $ORIGINAL_REPLICAS to $REPLICAS replicas..."
+      kubectl scale deployment "$BACKEND_DEPLOYMENT" -n "$BACKEND_NAMESPACE" --replicas="$REPLICAS" >/dev/null
+    fi
+    kubectl rollout status deployment "$BACKEND_DEPLOYMENT" -n "$BACKEND_NAMESPACE" --timeout=180s >/dev/null
+
+    # Skip pods still terminating after a scale-down (they would never see the new version)
+    SELECTOR=$(kubectl get deployment "$BACKEND_DEPLOYMENT" -n "$BACKEND_NAMESPACE" \
+      -o go-template='{{range $k, $v := .spec.selector.matchLabels}}{{$k}}={{$v}},{{end}}')
+    PODS=$(kubectl get pods -n "$BACKEND_NAMESPACE" -l "${SELECTOR%,}" \
+      -o go-template='{{range .items}}{{if not .metadata.deletionTimestamp}}{{.metadata.name}}{{"\n"}}{{end}}{{end}}')
+
+    log_info "Port-forwarding $(echo "$PODS" | wc -l) backend pods..."
+    port=$LOCAL_PORT_BASE
+    for pod in $PODS; do
+      kubectl port-forward -n "$BACKEND_NAMESPACE" "pod/$pod" "$port:$BACKEND_PORT" >/dev/null 2>&1 &
+      PF_PIDS+=($!)
+      for _ in $(seq 1 20); do
+        if (echo >"/dev/tcp/127.0.0.1/$port") 2>/dev/null; then
+          break
+        fi
+        sleep 0.5
+      done
+      REPLICA_ARGS+=(--replica "http://127.0.0.1:$port")
+      port=$(( port + 1 ))
+    done
+  else
+    for url in $REPLICA_URLS; do
+      REPLICA_ARGS+=(--replica "$url")
+    done
+  fi
+
+  log_info "Config propagation ($SAMPLES samples of '$CONFIG_KEY' across $(( ${#REPLICA_ARGS[@]} / 2 )) replicas)..."
+  python3 "$SCRIPT_DIR/propagation.py" \
+    --base-url "$BASE_URL" \
+    --key "$CONFIG_KEY" \
+    --samples "$SAMPLES" \
+    --output "$RUN_DIR/propagation.json" \
+    "${REPLICA_ARGS[@]}"
+  log_success "Config propagation complete"
+fi
+
+# Results + gate
+GIT_REV="$(git -C "$SCRIPT_DIR" rev-parse --short HEAD 2>/dev/null || echo "")" \
+python3 "$SCRIPT_DIR/gate.py" collect --run-dir "$RUN_DIR" --profile "$PROFILE" \
+  --param "SCENARIOS=$SCENARIOS" --param "DURATION=$DURATION" \
+  --param "SIGNIN_RATE=$SIGNIN_RATE" --param "READ_RATE=$READ_RATE" --param "READY_RATE=$READY_RATE" \
+  --param "USERS=$USERS" --param "CHAT_ROOMS=$CHAT_ROOMS" --param "CHAT_SOCKETS_PER_ROOM=$CHAT_SOCKETS_PER_ROOM" \
+  --param "REPLICAS=$REPLICAS" --param "SAMPLES=$SAMPLES" --param "RATE_LIMIT_SCALE=$RATE_LIMIT_SCALE"
+log_success "Results written to ${RUN_DIR#$SCRIPT_DIR/}/results.json"
+
+gate_rc=0
+python3 "$SCRIPT_DIR/gate.py" compare \
+  --results "$RUN_DIR/results.json" \
+  --baseline "$BASELINE" \
+  --slos "$SCRIPT_DIR/slos.json" \
+  --threshold "$THRESHOLD" \
+  --min-delta-ms "$MIN_DELTA_MS" || gate_rc=$?
+
+if [ "$UPDATE_BASELINE" = "1" ]; then
+  mkdir -p "$(dirname "$BASELINE")"
+  cp "$RUN_DIR/results.json" "$BASELINE"
+  log_success "Baseline updated: ${BASELINE#$SCRIPT_DIR/} (commit it)"
+fi
+
+if [ "$gate_rc" -ne 0 ]; then
+  echo -e "${RED}✗ Performance gate failed (SLO breach or regression > $(awk -v t="$THRESHOLD" 'BEGIN { print t * 100 }')%)${RESET}"
+  exit 1
+fi
+log_success "Performance gate passed"
@@ -0,0 +1,124 @@
+"""JTI denylist benchmark driver: EXISTS on every request vs. LocalDenylist Bloom pre-check.
+
+Seeds REVOKED revoked JTIs (SETEX key + stream entry, like a real logout), then runs the ADR-0004 check
+CONCURRENCY-wide for REQUESTS requests per mode and prints the measured check latency, Redis calls per
+request and false-positive rate. Invoked by run.sh; needs redis (redis-py).
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+import redis.asyncio as aioredis
+
+from denylist import LocalDenylist
+
+TOKEN_TTL_S = 900
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+async def seed(redis, args) -> list[tuple[str, int]]:
+    exp = int(time.time()) + TOKEN_TTL_S
+    revoked = [(str(uuid.uuid4()), exp) for _ in range(args.revoked)]
+    async with redis.pipeline(transaction=False) as pipe:
+        for jti, token_exp in revoked:
+            pipe.setex(f"{args.prefix}:{jti}", TOKEN_TTL_S, "revoked")
+            pipe.xadd(f"{args.prefix}:stream", {"jti": jti, "exp": token_exp})
+        await pipe.execute()
+    return revoked
+
+
+def workload(args, revoked: list[tuple[str, int]]) -> list[tuple[str, int, bool]]:
+    """(jti, exp, is_revoked) per request; REVOKED_SHARE of the requests carry a revoked token."""
+    exp = int(time.time()) + TOKEN_TTL_S
+    requests = []
+    for _ in range(args.requests):
+        if random.random() < args.revoked_share:
+            jti, token_exp = random.choice(revoked)
+            requests.append((jti, token_exp, True))
+        else:
+            requests.append((str(uuid.uuid4()), exp, False))
+    return requests
+
+
+async def run_mode(redis, args, requests, denylist: LocalDenylist | None) -> dict:
+    latencies: list[float] = []
+    counts = {"redis_calls": 0, "false_positives": 0, "rejected": 0}
+    queue = iter(requests)
+
+    async def check(jti: str, exp: int) -> bool:
+        # The read-path check from ADR-0004: local filter first, Redis only on "maybe"
+        if denylist is not None and not denylist.might_contain(jti, exp):
+            return False
+        counts["redis_calls"] += 1
+        return bool(await redis.exists(f"{args.prefix}:{jti}"))
+
+    async def loop():
+        for jti, exp, is_revoked in queue:
+            started = time.perf_counter()
+            revoked = await check(jti, exp)
+            latencies.append(time.perf_counter() - started)
+            if revoked != is_revoked:
+                raise SystemExit(f"Wrong answer for {jti}: revoked={revoked}, expected {is_revoked}")
+            counts["rejected"] += revoked
+
+    started = time.perf_counter()
+    await asyncio.gather(*(loop() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    legit = sum(1 for _, _, is_revoked in requests if not is_revoked)
+    if denylist is not None:
+        counts["false_positives"] = counts["redis_calls"] - counts["rejected"]
+    return {
+        "checks_per_s": len(latencies) / elapsed,
+        "p50": percentile(latencies, 0.50),
+        "p99": percentile(latencies, 0.99),
+        "redis_per_req": counts["redis_calls"] / len(latencies),
+        "fp_rate": counts["false_positives"] / max(1, legit) if denylist is not None else None,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", required=True, help="redis://:password@host:port/0")
+    parser.add_argument("--prefix", default="bench:denylist")
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--revoked", type=int, default=1000)
+    parser.add_argument("--revoked-share", type=float, default=0.0001)
+    args = parser.parse_args()
+
+    redis = aioredis.from_url(args.url, decode_responses=True, max_connections=args.concurrency + 1)
+    revoked = await seed(redis, args)
+    requests = workload(args, revoked)
+
+    results = {"without cache": await run_mode(redis, args, requests, None)}
+
+    denylist = LocalDenylist(redis, stream=f"{args.prefix}:stream")
+    consumer = asyncio.create_task(denylist.run())
+    while denylist._synced_at == 0.0:  # Startup replay + first XREAD done
+        await asyncio.sleep(0.05)
+    results["with cache"] = await run_mode(redis, args, requests, denylist)
+    consumer.cancel()
+    await redis.aclose()
+
+    print(f"\n{'Mode':<15} {'checks/s':>10} {'p50 (ms)':>10} {'p99 (ms)':>10} {'Redis calls/req':>16} {'FP rate':>9}")
+    for mode, r in results.items():
+        fp = f"{r['fp_rate']:.4%}" if r["fp_rate"] is not None else "-"
+        print(
+            f"{mode:<15} {r['checks_per_s']:>10.0f} {r['p50']:>10.3f} {r['p99']:>10.3f} "
+            f"{r['redis_per_req']:>16.4f} {fp:>9}"
+        )
+    print(f"\nRedis round trips avoided: {1 - results['with cache']['redis_per_req']:.2%}\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""Local JTI denylist with Bloom pre-check (ADR-0004, "Local Denylist Cache").
+
+Reference implementation of the ADR-0004 denylist code (without the Prometheus counters) used by the benchmark;
+change it together with the ADR until the Phase 2 backend exists.
+"""
+
+import hashlib
+import math
+import time
+
+BUCKET_SECONDS = 300  # Filters are bucketed by token expiry, 3 live buckets cover the 900s TTL
+
+
+class BloomFilter:
+    def __init__(self, capacity=10_000, error_rate=0.001):
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)  # ~144k bits = 18 KB
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))            # ~10
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))  # Double hashing
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class LocalDenylist:
+    def __init__(self, redis, stream="auth:denylist", max_lag_s=1.0):
+        self._buckets: dict[int, BloomFilter] = {}
+        self._redis, self._stream, self._max_lag = redis, stream, max_lag_s
+        self._last_id, self._synced_at = "0-0", 0.0
+
+    def might_contain(self, jti: str, exp: int) -> bool:
+        if time.monotonic() - self._synced_at > self._max_lag:
+            return True  # Fail closed: stream consumer lagging → always ask Redis
+        bucket = self._buckets.get(exp // BUCKET_SECONDS)
+        hit = bucket is not None and jti in bucket
+        return hit
+
+    def _add(self, jti: str, exp: int):
+        self._buckets.setdefault(exp // BUCKET_SECONDS, BloomFilter()).add(jti)
+
+    async def run(self):
+        # Startup: replay the last 900s (stream is trimmed to that window by MINID)
+        start = f"{int(time.time() * 1000) - 900_000}-0"
+        for entry_id, fields in await self._redis.xrange(self._stream, min=start):
+            self._add(fields["jti"], int(fields["exp"]))
+            self._last_id = entry_id
+        while True:
+            # BLOCK 500ms < max_lag: an idle stream still refreshes _synced_at
+            streams = await self._redis.xread({self._stream: self._last_id}, block=500)
+            for _, entries in streams:
+                for entry_id, fields in entries:
+                    self._add(fields["jti"], int(fields["exp"]))
+                    self._last_id = entry_id
+            self._synced_at = time.monotonic()
+            # Expire whole buckets once every token in them is past exp
+            expired = int(time.time()) // BUCKET_SECONDS
+            for key in [k for k in self._buckets if k < expired]:
+                del self._buckets[key]
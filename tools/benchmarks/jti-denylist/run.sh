@@ -0,0 +1,111 @@
+#!/bin/bash
+################################################################################
+# 📈 Benchmark: JTI Denylist Check (Redis EXISTS vs. Local Bloom Pre-Check)
+#
+# Purpose: Quantifies the per-request cost of the ADR-0004 denylist check on the
+#          authenticated read path (GET /api/projects/{project_id})
+# Runtime: ~30 seconds
+#
+# Requirements:
+#   - python3 with redis-py on the host (pip install redis)
+#   - kubectl port-forward to redis-master-0 (started and stopped by this script)
+#
+# Scenario:
+#   - REVOKED revoked JTIs seeded like a real logout (SETEX 900s + denylist stream entry)
+#   - CLIENTS concurrent request loops run REQUESTS denylist checks per mode,
+#     REVOKED_SHARE of them with a revoked token
+#
+# Modes (both run the ADR-0004 code, bench.py + denylist.py):
+#   without cache  every request pays one EXISTS round trip
+#   with cache     LocalDenylist Bloom pre-check; only "maybe" answers (revoked
+#                  tokens plus false positives) reach Redis
+#
+# Note:
+#   Both modes go through the same port-forward, so the Redis round trip is
+#   inflated; compare the modes, not the numbers against production.
+#
+# Environment:
+#   REQUESTS=100000  CLIENTS=50  REVOKED=1000  REVOKED_SHARE=0.0001  LOCAL_PORT=16379
+#
+# Usage:
+#   ./tools/benchmarks/jti-denylist/run.sh
+################################################################################
+
+set -euo pipefail
+
+# Color codes
+RESET='\033[0m'
+GREEN='\033[0;32m'
+CYAN='\033[0;36m'
+YELLOW='\033[1;33m'
+
+NAMESPACE="demo-platform"
+REDIS_POD="redis-master-0"
+REDIS_AUTH="-a redispass --no-auth-warning"
+KEY_PREFIX="bench:denylist"
+
+REQUESTS="${REQUESTS:-100000}"
+CLIENTS="${CLIENTS:-50}"
+REVOKED="${REVOKED:-1000}"
+REVOKED_SHARE="${REVOKED_SHARE:-0.0001}"
+LOCAL_PORT="${LOCAL_PORT:-16379}"
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+
+log_info() {
+  echo -e "${CYAN}➜ $1${RESET}"
+}
+
+log_success() {
+  echo -e "${GREEN}✓ $1${RESET}"
+}
+
+log_warning() {
+  echo -e "${YELLOW}⚠ $1${RESET}"
+}
+
+redis_exec() {
+  kubectl exec -n "$NAMESPACE" "$REDIS_POD" -- sh -c "$1"
+}
+
+echo -e "${CYAN}╔════════════════════════════════════════════════════════╗${RESET}"
+echo -e "${CYAN}║  📈 Benchmark: JTI Denylist Check                     ║${RESET}"
+echo -e "${CYAN}╚════════════════════════════════════════════════════════╝${RESET}"
+echo ""
+
+if ! python3 -c "import redis" >/dev/null 2>&1; then
+  log_warning "Python package redis not found"
+  echo "  Install: python3 -m pip install redis"
+  exit 1
+fi
+
+if ! kubectl get pod -n "$NAMESPACE" "$REDIS_POD" >/dev/null 2>&1; then
+  log_warning "Redis pod '$REDIS_POD' not found in namespace '$NAMESPACE'"
+  echo "  Run Phase 0 Block 6 first: ./setup-template/phase0-template-foundation/06-deploy-databases/deploy.sh"
+  exit 1
+fi
+
+log_info "Port-forwarding $REDIS_POD to localhost:$LOCAL_PORT..."
+kubectl port-forward -n "$NAMESPACE" "pod/$REDIS_POD" "$LOCAL_PORT:6379" >/dev/null 2>&1 &
+PF_PID=$!
+trap 'kill $PF_PID 2>/dev/null || true' EXIT
+for _ in $(seq 1 20); do
+  if (echo >"/dev/tcp/127.0.0.1/$LOCAL_PORT") 2>/dev/null; then
+    break
+  fi
+  sleep 0.5
+done
+log_success "Port-forward ready"
+
+log_info "Running $REQUESTS checks per mode ($CLIENTS clients, $REVOKED revoked JTIs)..."
+python3 "$SCRIPT_DIR/bench.py" \
+  --url "redis://:redispass@127.0.0.1:$LOCAL_PORT/0" \
+  --prefix "$KEY_PREFIX" \
+  --requests "$REQUESTS" \
+  --concurrency "$CLIENTS" \
+  --revoked "$REVOKED" \
+  --revoked-share "$REVOKED_SHARE"
+
+log_info "Cleaning up benchmark keys..."
+redis_exec "redis-cli $REDIS_AUTH --scan --pattern '$KEY_PREFIX:*' | xargs -r redis-cli $REDIS_AUTH DEL" >/dev/null
+log_success "Benchmark keys removed"
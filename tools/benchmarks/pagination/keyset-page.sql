@@ -0,0 +1,7 @@
+-- One page via keyset cursor (created_at, project_id) of the previous page's last row
+SELECT project_id, org_id, name, created_at, updated_at
+FROM bench_pagination.projects
+WHERE org_id = '550e8400-e29b-41d4-a716-446655440000'
+  AND (created_at, project_id) < (:cursor_ts::timestamptz, :cursor_id::uuid)
+ORDER BY created_at DESC, project_id DESC
+LIMIT :page_size + 1;
@@ -0,0 +1,6 @@
+-- One page via LIMIT/OFFSET (current API behaviour)
+SELECT project_id, org_id, name, created_at, updated_at
+FROM bench_pagination.projects
+WHERE org_id = '550e8400-e29b-41d4-a716-446655440000'
+ORDER BY created_at DESC, project_id DESC
+LIMIT :page_size OFFSET :page_offset;
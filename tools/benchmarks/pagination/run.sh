@@ -0,0 +1,126 @@
+#!/bin/bash
+################################################################################
+# 📈 Benchmark: Pagination (Offset vs. Keyset)
+#
+# Purpose: Pages through one tenant with 1M projects and compares page latency
+#          at increasing depth for LIMIT/OFFSET vs. keyset cursors
+#          (docs/api/conventions.md §7) against the Phase 0 PostgreSQL
+# Runtime: ~2 minutes (seed ~30s + measurements)
+#
+# Scenario:
+#   - PROJECTS rows in one organization, PAGE_SIZE rows per page
+#   - For each depth in PAGES (page numbers), SAMPLES page fetches per mode
+#   - Both modes use prepared statements (-M prepared), like asyncpg
+#
+# Environment:
+#   PROJECTS=1000000  PAGE_SIZE=20  PAGES="1 100 1000 10000 50000"  SAMPLES=20  KEEP_DATA=0
+#
+# Usage:
+#   ./tools/benchmarks/pagination/run.sh
+################################################################################
+
+set -euo pipefail
+
+# Color codes
+RESET='\033[0m'
+GREEN='\033[0;32m'
+CYAN='\033[0;36m'
+YELLOW='\033[1;33m'
+
+NAMESPACE="demo-platform"
+PG_POD="postgresql-0"
+PG_ENV="PGPASSWORD=demopass"
+PG_ARGS="-U demouser -d demodb"
+
+PROJECTS="${PROJECTS:-1000000}"
+PAGE_SIZE="${PAGE_SIZE:-20}"
+PAGES="${PAGES:-1 100 1000 10000 50000}"
+SAMPLES="${SAMPLES:-20}"
+KEEP_DATA="${KEEP_DATA:-0}"
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+
+log_info() {
+  echo -e "${CYAN}➜ $1${RESET}"
+}
+
+log_success() {
+  echo -e "${GREEN}✓ $1${RESET}"
+}
+
+log_warning() {
+  echo -e "${YELLOW}⚠ $1${RESET}"
+}
+
+# Copy a local file into the PostgreSQL pod (no tar/kubectl cp dependency)
+copy_to_pod() {
+  kubectl exec -i -n "$NAMESPACE" "$PG_POD" -- sh -c "cat > /tmp/$(basename "$1")" < "$1"
+}
+
+psql_value() {
+  kubectl exec -n "$NAMESPACE" "$PG_POD" -- env "$PG_ENV" psql $PG_ARGS -qtAX -c "$1"
+}
+
+# Average latency (ms) of SAMPLES runs of one page script
+pgbench_latency() {
+  local script="$1"
+  shift
+  kubectl exec -n "$NAMESPACE" "$PG_POD" -- env "$PG_ENV" \
+    pgbench -n $PG_ARGS -M prepared -c 1 -t "$SAMPLES" -D page_size="$PAGE_SIZE" "$@" -f "/tmp/$script" 2>&1 \
+    | awk '/latency average/ {print $4}'
+}
+
+echo -e "${CYAN}╔════════════════════════════════════════════════════════╗${RESET}"
+echo -e "${CYAN}║  📈 Benchmark: Pagination (Offset vs. Keyset)         ║${RESET}"
+echo -e "${CYAN}╚════════════════════════════════════════════════════════╝${RESET}"
+echo ""
+
+if ! kubectl get pod -n "$NAMESPACE" "$PG_POD" >/dev/null 2>&1; then
+  log_warning "PostgreSQL pod '$PG_POD' not found in namespace '$NAMESPACE'"
+  echo "  Run Phase 0 Block 6 first: ./setup-template/phase0-template-foundation/06-deploy-databases/deploy.sh"
+  exit 1
+fi
+
+log_info "Copying benchmark scripts into $PG_POD..."
+for file in seed.sql offset-page.sql keyset-page.sql; do
+  copy_to_pod "$SCRIPT_DIR/$file"
+done
+log_success "Scripts copied"
+
+log_info "Seeding $PROJECTS projects (schema bench_pagination)..."
+kubectl exec -n "$NAMESPACE" "$PG_POD" -- env "$PG_ENV" psql $PG_ARGS -q -v ON_ERROR_STOP=1 \
+  -v projects="$PROJECTS" -f /tmp/seed.sql >/dev/null
+log_success "Seed complete"
+
+printf "\n%-8s %12s %14s %14s\n" "Page" "Offset" "offset (ms)" "keyset (ms)"
+for page in $PAGES; do
+  offset=$(( (page - 1) * PAGE_SIZE ))
+  if [ "$offset" -ge "$PROJECTS" ]; then
+    continue
+  fi
+
+  if [ "$page" -eq 1 ]; then
+    # First page has no cursor: a cursor "after the newest row" returns the same rows
+    cursor_ts="infinity"
+    cursor_id="ffffffff-ffff-ffff-ffff-ffffffffffff"
+  else
+    # Cursor = sort key of the last row on the previous page (what next_cursor encodes)
+    cursor=$(psql_value "SELECT to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD\"T\"HH24:MI:SS.US\"Z\"') || ' ' || project_id
+      FROM bench_pagination.projects
+      WHERE org_id = '550e8400-e29b-41d4-a716-446655440000'
+      ORDER BY created_at DESC, project_id DESC
+      OFFSET $(( offset - 1 )) LIMIT 1;")
+    read -r cursor_ts cursor_id <<< "$cursor"
+  fi
+
+  offset_ms=$(pgbench_latency offset-page.sql -D page_offset="$offset")
+  keyset_ms=$(pgbench_latency keyset-page.sql -D cursor_ts="$cursor_ts" -D cursor_id="$cursor_id")
+  printf "%-8s %12s %14s %14s\n" "$page" "$offset" "$offset_ms" "$keyset_ms"
+done
+echo ""
+
+if [ "$KEEP_DATA" != "1" ]; then
+  kubectl exec -n "$NAMESPACE" "$PG_POD" -- env "$PG_ENV" psql $PG_ARGS -q \
+    -c "DROP SCHEMA IF EXISTS bench_pagination CASCADE;" >/dev/null
+  log_success "Benchmark schema dropped (KEEP_DATA=1 to keep it)"
+fi
@@ -0,0 +1,27 @@
+-- Seed data for the pagination benchmark: one large tenant with :projects projects
+-- Variables: :projects
+
+DROP SCHEMA IF EXISTS bench_pagination CASCADE;
+CREATE SCHEMA bench_pagination;
+SET search_path TO bench_pagination;
+
+CREATE TABLE projects (
+    project_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    org_id UUID NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    description VARCHAR(500),
+    created_at TIMESTAMPTZ NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- 4 projects share each created_at value, so the project_id tie-breaker is exercised
+INSERT INTO projects (org_id, name, created_at)
+SELECT '550e8400-e29b-41d4-a716-446655440000', 'project-' || i, NOW() - (i / 4) * INTERVAL '1 second'
+FROM generate_series(1, :projects) AS i;
+
+-- Keyset index (docs/api/conventions.md §7)
+CREATE INDEX idx_projects_keyset ON projects (org_id, created_at DESC, project_id DESC);
+
+ANALYZE projects;
+
+SELECT COUNT(*) AS projects FROM projects;
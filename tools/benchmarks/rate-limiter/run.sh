@@ -0,0 +1,186 @@
+#!/bin/bash
+################################################################################
+# 📈 Benchmark: Sliding-Window Rate Limiter (Correctness + Throughput)
+#
+# Purpose: Verifies the ADR-0004 §5 Lua script never admits more than the limit
+#          under concurrency, and measures its throughput/latency in Redis
+# Runtime: ~30 seconds
+#
+# Checks:
+#   1. User limit      CLIENTS concurrent clients send ATTEMPTS checks for one user
+#                      → exactly LIMIT tokens granted (lease 1 and lease LEASE)
+#   2. Org limit       random users of one org → org total exactly ORG_LIMIT
+#   3. Partial grants  a lease larger than the remaining window is cut down,
+#                      an empty window returns 0 tokens and a Retry-After
+#   4. Refunds         unused lease tokens passed to the next call are given
+#                      back to every scope of the window they were charged to
+#
+# Throughput:
+#   EVALSHA with random user keys (one Redis check per call), then the request
+#   rate one Redis node can serve when pods lease LEASE tokens per check
+#
+# Note:
+#   redis-benchmark runs inside redis-master-0 (loopback), so the measured round
+#   trip is a lower bound; pod-to-pod traffic adds network latency on top.
+#
+# Environment:
+#   LIMIT=100  ORG_LIMIT=1000  LEASE=5  ATTEMPTS=5000  CLIENTS=50  REQUESTS=100000
+#
+# Usage:
+#   ./tools/benchmarks/rate-limiter/run.sh
+################################################################################
+
+set -euo pipefail
+
+# Color codes
+RESET='\033[0m'
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+CYAN='\033[0;36m'
+YELLOW='\033[1;33m'
+
+NAMESPACE="demo-platform"
+REDIS_POD="redis-master-0"
+REDIS_AUTH="-a redispass --no-auth-warning"
+KEY_PREFIX="bench:ratelimit"
+WINDOW_MS=3600000  # 1h window: correctness runs never straddle a window boundary in practice
+
+LIMIT="${LIMIT:-100}"
+ORG_LIMIT="${ORG_LIMIT:-1000}"
+LEASE="${LEASE:-5}"
+ATTEMPTS="${ATTEMPTS:-5000}"
+CLIENTS="${CLIENTS:-50}"
+REQUESTS="${REQUESTS:-100000}"
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+FAILED=0
+
+log_info() {
+  echo -e "${CYAN}➜ $1${RESET}"
+}
+
+log_success() {
+  echo -e "${GREEN}✓ $1${RESET}"
+}
+
+log_warning() {
+  echo -e "${YELLOW}⚠ $1${RESET}"
+}
+
+log_error() {
+  echo -e "${RED}✗ $1${RESET}"
+  FAILED=1
+}
+
+redis_exec() {
+  kubectl exec -n "$NAMESPACE" "$REDIS_POD" -- sh -c "$1"
+}
+
+# Tokens granted so far = sum of the window counters in one hash
+granted_total() {
+  redis_exec "redis-cli $REDIS_AUTH HVALS $1" | awk '{s += $1} END {print s + 0}'
+}
+
+# EVALSHA <requested> <user limit> <org limit> <user key> <org key> [<refund> <refund window>]
+evalsha() {
+  redis_exec "redis-cli $REDIS_AUTH EVALSHA $SHA 2 $4 $5 $WINDOW_MS $1 ${6:-0} ${7:-0} $2 $3" | tr '\n' ' '
+}
+
+cleanup_keys() {
+  redis_exec "redis-cli $REDIS_AUTH --scan --pattern '$KEY_PREFIX:*' | xargs -r redis-cli $REDIS_AUTH DEL" >/dev/null
+}
+
+expect_total() {
+  local name="$1" key="$2" expected="$3" actual
+  actual=$(granted_total "$key")
+  if [ "$actual" -eq "$expected" ]; then
+    log_success "$name: granted $actual / $expected"
+  else
+    log_error "$name: granted $actual, expected $expected"
+  fi
+}
+
+echo -e "${CYAN}╔════════════════════════════════════════════════════════╗${RESET}"
+echo -e "${CYAN}║  📈 Benchmark: Sliding-Window Rate Limiter            ║${RESET}"
+echo -e "${CYAN}╚════════════════════════════════════════════════════════╝${RESET}"
+echo ""
+
+if ! kubectl get pod -n "$NAMESPACE" "$REDIS_POD" >/dev/null 2>&1; then
+  log_warning "Redis pod '$REDIS_POD' not found in namespace '$NAMESPACE'"
+  echo "  Run Phase 0 Block 6 first: ./setup-template/phase0-template-foundation/06-deploy-databases/deploy.sh"
+  exit 1
+fi
+
+cleanup_keys  # Leftovers of an aborted run would break the exact counts
+
+log_info "Loading sliding window script..."
+kubectl exec -i -n "$NAMESPACE" "$REDIS_POD" -- sh -c "cat > /tmp/sliding_window.lua" < "$SCRIPT_DIR/sliding_window.lua"
+SHA=$(redis_exec "redis-cli $REDIS_AUTH SCRIPT LOAD \"\$(cat /tmp/sliding_window.lua)\"")
+log_success "Script loaded ($SHA)"
+echo ""
+
+# 1. User limit under concurrency, without and with leases
+for lease in 1 "$LEASE"; do
+  log_info "User limit: $CLIENTS clients, $ATTEMPTS checks, lease $lease..."
+  redis_exec "redis-benchmark $REDIS_AUTH -q -c $CLIENTS -n $ATTEMPTS \
+    EVALSHA $SHA 2 $KEY_PREFIX:user:lease$lease $KEY_PREFIX:org:lease$lease $WINDOW_MS $lease 0 0 $LIMIT $ORG_LIMIT" >/dev/null
+  expect_total "User limit (lease $lease)" "$KEY_PREFIX:user:lease$lease" "$LIMIT"
+  expect_total "Org charged with user (lease $lease)" "$KEY_PREFIX:org:lease$lease" "$LIMIT"
+done
+
+# 2. Org limit shared by many users (__rand_int__ = random user id)
+log_info "Org limit: random users, one org..."
+redis_exec "redis-benchmark $REDIS_AUTH -q -c $CLIENTS -n $ATTEMPTS -r 1000000 \
+  EVALSHA $SHA 2 $KEY_PREFIX:user:__rand_int__ $KEY_PREFIX:org:shared $WINDOW_MS 1 0 0 $LIMIT $ORG_LIMIT" >/dev/null
+expect_total "Org limit" "$KEY_PREFIX:org:shared" "$ORG_LIMIT"
+
+# 3. Partial grants and Retry-After (reply: granted remaining reset_ms retry_after_ms window)
+log_info "Partial grants..."
+user="$KEY_PREFIX:user:partial"
+org="$KEY_PREFIX:org:partial"
+read -r g1 _ <<< "$(evalsha 7 10 "$ORG_LIMIT" "$user" "$org")"
+read -r g2 r2 _ <<< "$(evalsha 7 10 "$ORG_LIMIT" "$user" "$org")"
+read -r g3 r3 reset3 retry3 _ <<< "$(evalsha 1 10 "$ORG_LIMIT" "$user" "$org")"
+if [ "$g1" -eq 7 ] && [ "$g2" -eq 3 ] && [ "$r2" -eq 0 ] && [ "$g3" -eq 0 ] && [ "$retry3" -gt 0 ]; then
+  log_success "Partial grants: 7 + 3 of 10, then denied (Retry-After $(( (retry3 + 999) / 1000 ))s, reset in $(( reset3 / 1000 ))s)"
+else
+  log_error "Partial grants: got $g1, $g2 (remaining $r2), $g3 (retry ${retry3}ms)"
+fi
+
+# 4. Refund: lease 7, spend 2, return the other 5 with the next call (which takes 1)
+log_info "Lease refunds..."
+user="$KEY_PREFIX:user:refund"
+org="$KEY_PREFIX:org:refund"
+read -r _ _ _ _ window <<< "$(evalsha 7 "$LIMIT" "$ORG_LIMIT" "$user" "$org")"
+evalsha 1 "$LIMIT" "$ORG_LIMIT" "$user" "$org" 5 "$window" >/dev/null
+expect_total "Refund (user)" "$user" 3
+expect_total "Refund (org)" "$org" 3
+echo ""
+
+# Throughput: one Redis check per call, random users so limits are never hit
+log_info "Measuring EVALSHA throughput ($CLIENTS clients, $REQUESTS requests)..."
+# CSV: "test","rps","avg_latency_ms","min_latency_ms","p50_latency_ms","p95_latency_ms","p99_latency_ms","max_latency_ms"
+result=$(redis_exec "redis-benchmark $REDIS_AUTH --csv -c $CLIENTS -n $REQUESTS -r 1000000 \
+  EVALSHA $SHA 2 $KEY_PREFIX:user:__rand_int__ $KEY_PREFIX:org:__rand_int__ 60000 1 0 0 1000000 1000000" | tail -n1 | tr -d '"')
+rps=$(echo "$result" | cut -d, -f2)
+p50=$(echo "$result" | cut -d, -f5)
+p99=$(echo "$result" | cut -d, -f7)
+log_success "EVALSHA: p50=${p50} ms, p99=${p99} ms, ${rps} checks/s"
+
+log_info "Cleaning up benchmark keys..."
+cleanup_keys
+log_success "Benchmark keys removed"
+
+# With a lease of L tokens, a steady request stream needs one Redis check per L requests
+awk -v rps="$rps" -v lease="$LEASE" '
+  BEGIN {
+    printf "\n%-12s %18s %22s\n", "Mode", "Redis calls/req", "Requests/s per Redis"
+    printf "%-12s %18.2f %22.0f\n", "no lease", 1, rps
+    printf "%-12s %18.2f %22.0f\n", "lease " lease, 1 / lease, rps * lease
+    printf "\nRedis round trips avoided: %.0f%%\n\n", (1 - 1 / lease) * 100
+  }'
+
+if [ "$FAILED" -ne 0 ]; then
+  log_error "Correctness checks failed"
+  exit 1
+fi
@@ -0,0 +1,48 @@
+-- Sliding window rate limit check: reference implementation of the ADR-0004 §5 script (change both together)
+-- KEYS: one hash per scope; ARGV: window_ms, requested, refund, refund_window, limit per key
+-- Returns: {granted, remaining, reset_ms, retry_after_ms, window}
+local t = redis.call('TIME')  -- Redis clock: pods with skewed clocks share one window
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local window = tonumber(ARGV[1])
+local requested = tonumber(ARGV[2])
+local cur = math.floor(now / window)
+local elapsed = (now % window) / window
+local reset_ms = window - now % window
+
+-- Unused tokens of this pod's previous lease go back to the window they were charged to
+local refund, refund_window = tonumber(ARGV[3]), tonumber(ARGV[4])
+if refund > 0 and refund_window >= cur - 1 then
+  for _, key in ipairs(KEYS) do
+    local charged = tonumber(redis.call('HGET', key, tostring(refund_window)) or 0)
+    redis.call('HSET', key, tostring(refund_window), math.max(0, charged - refund))
+  end
+end
+
+local granted, remaining, retry_ms = requested, math.huge, 0
+for i, key in ipairs(KEYS) do
+  local limit = tonumber(ARGV[4 + i])
+  local c = tonumber(redis.call('HGET', key, tostring(cur)) or 0)
+  local p = tonumber(redis.call('HGET', key, tostring(cur - 1)) or 0)
+  local free = math.max(0, limit - math.floor(p * (1 - elapsed)) - c)
+  granted = math.min(granted, free)
+  remaining = math.min(remaining, free)
+  if free == 0 then
+    -- Time until the weighted count drops below the limit again (+1ms: floor() must cross it)
+    local wait
+    if c < limit then
+      wait = math.max(1, math.floor((1 - (limit - c) / p - elapsed) * window) + 1)
+    else
+      wait = reset_ms + math.floor((1 - limit / c) * window) + 1
+    end
+    retry_ms = math.max(retry_ms, wait)
+  end
+end
+
+if granted > 0 then
+  for _, key in ipairs(KEYS) do
+    redis.call('HINCRBY', key, tostring(cur), granted)
+    redis.call('HDEL', key, tostring(cur - 2))
+    redis.call('PEXPIRE', key, window * 2)
+  end
+end
+return {granted, remaining - granted, reset_ms, retry_ms, cur}
@@ -0,0 +1,147 @@
+"""Tenant pool benchmark driver: one-SET-per-request vs. RLS-aware pool with session pinning.
+
+Runs CONCURRENCY request loops against ORGS tenants for DURATION seconds per mode and prints
+request latency, pool wait and checkout percentiles. Invoked by run.sh; needs asyncpg.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import time
+from uuid import UUID
+
+import asyncpg
+
+from tenant_pool import HOT_QUERIES, PoolStats, TenantPool
+
+SERVER_SETTINGS = {"search_path": "bench_tenant"}
+QUERY_MIX = [("config_lookup", 0.6), ("project_list", 0.3), ("org_get", 0.1)]
+
+
+def org_uuid(n: int) -> UUID:
+    return UUID(hashlib.md5(f"org-{n}".encode()).hexdigest())  # Matches md5('org-N')::uuid in seed.sql
+
+
+def query_args(name: str, org_id: UUID, configs_per_org: int) -> tuple:
+    if name == "config_lookup":
+        return org_id, "api", f"key-{random.randint(1, configs_per_org)}"
+    if name == "project_list":
+        return org_id, 20
+    return (org_id,)
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+async def run_naive(args, orgs: list[UUID]) -> tuple[list[float], PoolStats]:
+    """Current pattern: SET app.org_id on every checkout, asyncpg's default reset on release."""
+    pool = await asyncpg.create_pool(
+        args.dsn, min_size=args.pool_size, max_size=args.pool_size, server_settings=SERVER_SETTINGS
+    )
+    stats = PoolStats()
+
+    async def request(org_id: UUID, name: str):
+        started = time.perf_counter()
+        async with pool.acquire() as conn:
+            acquired = time.perf_counter()
+            stats.wait_s.append(acquired - started)
+            await conn.execute(f"SET app.org_id = '{org_id}'")
+            await conn.fetch(HOT_QUERIES[name], *query_args(name, org_id, args.configs_per_org))
+            stats.switched += 1
+        stats.checkout_s.append(time.perf_counter() - acquired)  # Includes the reset on release
+
+    latencies = await drive(args, orgs, request)
+    await pool.close()
+    return latencies, stats
+
+
+async def run_pinned(args, orgs: list[UUID]) -> tuple[list[float], PoolStats]:
+    """New layer: tenant-pinned connections, prepared hot queries, no reset on release."""
+    pool = TenantPool(args.dsn, size=args.pool_size, server_settings=SERVER_SETTINGS)
+    await pool.start()
+
+    async def request(org_id: UUID, name: str):
+        async with pool.tenant(org_id) as db:
+            await db.fetch(name, *query_args(name, org_id, args.configs_per_org))
+
+    latencies = await drive(args, orgs, request)
+    await pool.close()
+    return latencies, pool.stats
+
+
+async def drive(args, orgs: list[UUID], request) -> list[float]:
+    names, weights = zip(*QUERY_MIX)
+    latencies: list[float] = []
+    deadline = time.perf_counter() + args.duration
+
+    async def loop():
+        while time.perf_counter() < deadline:
+            org_id = random.choice(orgs)
+            name = random.choices(names, weights)[0]
+            started = time.perf_counter()
+            await request(org_id, name)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(loop() for _ in range(args.concurrency)))
+    return latencies
+
+
+async def check_isolation(args, orgs: list[UUID]) -> bool:
+    """RLS must hide other tenants' rows (superusers and BYPASSRLS roles skip policies)."""
+    conn = await asyncpg.connect(args.dsn, server_settings=SERVER_SETTINGS)
+    try:
+        await conn.execute(f"SET app.org_id = '{orgs[0]}'")
+        visible = await conn.fetchval("SELECT count(DISTINCT org_id) FROM projects")
+        await conn.execute("RESET app.org_id")
+        unscoped = await conn.fetchval("SELECT count(*) FROM projects")
+        return visible == 1 and unscoped == 0
+    finally:
+        await conn.close()
+
+
+def report(mode: str, duration: float, latencies: list[float], stats: PoolStats):
+    statements = stats.pinned + stats.switched
+    print(
+        f"{mode:<8} {len(latencies) / duration:>9.0f} "
+        f"{percentile(latencies, 0.50):>8.2f} {percentile(latencies, 0.99):>8.2f} "
+        f"{percentile(stats.wait_s, 0.50):>8.2f} {percentile(stats.wait_s, 0.99):>8.2f} "
+        f"{percentile(stats.checkout_s, 0.50):>8.2f} {percentile(stats.checkout_s, 0.99):>8.2f} "
+        f"{stats.switched / max(1, statements):>8.1%}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dsn", required=True)
+    parser.add_argument("--mode", choices=["naive", "pinned", "both"], default="both")
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--orgs", type=int, default=100)
+    parser.add_argument("--configs-per-org", type=int, default=50)
+    parser.add_argument("--pool-size", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30)
+    args = parser.parse_args()
+
+    orgs = [org_uuid(n) for n in range(1, args.orgs + 1)]
+    if not await check_isolation(args, orgs):
+        print("⚠ RLS is not enforced for this role (superuser or BYPASSRLS?) - latencies are still comparable")
+
+    results = {}
+    for mode in ["naive", "pinned"] if args.mode == "both" else [args.mode]:
+        results[mode] = await (run_naive if mode == "naive" else run_pinned)(args, orgs)
+
+    print(
+        f"\n{'Mode':<8} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'wait p50':>8} {'wait p99':>8} {'held p50':>8} {'held p99':>8} {'SET/req':>8}"
+    )
+    for mode, (latencies, stats) in results.items():
+        report(mode, args.duration, latencies, stats)
+    print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+-- Seed data for the tenant pool benchmark: :orgs organizations with RLS-protected tables
+-- Variables: :orgs, :projects_per_org, :configs_per_org
+
+DROP SCHEMA IF EXISTS bench_tenant CASCADE;
+CREATE SCHEMA bench_tenant;
+SET search_path TO bench_tenant;
+
+-- Org IDs are md5('org-N')::uuid so bench.py can derive them without a lookup
+CREATE TABLE organizations (
+    org_id UUID PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE projects (
+    project_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    org_id UUID NOT NULL REFERENCES organizations(org_id),
+    name VARCHAR(100) NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE TABLE service_configs (
+    id SERIAL PRIMARY KEY,
+    org_id UUID NOT NULL REFERENCES organizations(org_id),
+    service VARCHAR(50) NOT NULL,
+    key VARCHAR(100) NOT NULL,
+    value TEXT NOT NULL,
+    version INT NOT NULL DEFAULT 1,
+    UNIQUE (org_id, service, key)
+);
+
+INSERT INTO organizations (org_id, name)
+SELECT md5('org-' || o)::uuid, 'org-' || o
+FROM generate_series(1, :orgs) AS o;
+
+INSERT INTO projects (org_id, name, created_at)
+SELECT md5('org-' || o)::uuid, 'project-' || p, NOW() - p * INTERVAL '1 minute'
+FROM generate_series(1, :orgs) AS o, generate_series(1, :projects_per_org) AS p;
+
+INSERT INTO service_configs (org_id, service, key, value)
+SELECT md5('org-' || o)::uuid, 'api', 'key-' || k, (random() * 100)::int::text
+FROM generate_series(1, :orgs) AS o, generate_series(1, :configs_per_org) AS k;
+
+CREATE INDEX idx_projects_keyset ON projects (org_id, created_at DESC, project_id DESC);
+
+-- RLS: FORCE applies the policies to the table owner too (the app role owns the tables here).
+-- NULLIF: after RESET, a custom setting reads as '' rather than NULL.
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['organizations', 'projects', 'service_configs'] LOOP
+        EXECUTE format('ALTER TABLE %I ENABLE ROW LEVEL SECURITY', t);
+        EXECUTE format('ALTER TABLE %I FORCE ROW LEVEL SECURITY', t);
+        EXECUTE format(
+            'CREATE POLICY tenant_isolation ON %I USING (org_id = NULLIF(current_setting(''app.org_id'', true), '''')::uuid)',
+            t
+        );
+    END LOOP;
+END $$;
+
+ANALYZE organizations;
+ANALYZE projects;
+ANALYZE service_configs;
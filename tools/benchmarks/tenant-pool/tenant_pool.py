@@ -0,0 +1,185 @@
+"""RLS-aware asyncpg pool with per-tenant session pinning (ADR-0001, "Tenant Isolation & Connection Pool").
+
+Reference implementation of the ADR-0001 tenant pool used by the benchmark; change it together with the ADR until
+the Phase 2 backend exists.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, defaultdict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from uuid import UUID
+
+import asyncpg
+
+# Hot queries, prepared once per connection. The explicit org_id filter keeps the index
+# scans; the RLS policy on app.org_id is the isolation guarantee.
+HOT_QUERIES = {
+    "config_lookup": "SELECT value, version FROM service_configs WHERE org_id = $1 AND service = $2 AND key = $3",
+    "project_list": (
+        "SELECT project_id, name, created_at FROM projects WHERE org_id = $1 "
+        "ORDER BY created_at DESC, project_id DESC LIMIT $2"
+    ),
+    "org_get": "SELECT org_id, name, created_at FROM organizations WHERE org_id = $1",
+}
+SET_TENANT = "SELECT set_config('app.org_id', $1, false)"
+MAX_SKIPS = 8  # A waiter can be passed over by same-tenant waiters at most this often
+
+
+@dataclass(eq=False)
+class _Waiter:
+    org_id: UUID
+    future: asyncio.Future
+    skipped: int = 0
+
+
+@dataclass
+class PoolStats:
+    wait_s: list[float] = field(default_factory=list)
+    checkout_s: list[float] = field(default_factory=list)
+    pinned: int = 0
+    switched: int = 0
+
+
+class TenantConnection:
+    """A checked-out connection bound to one tenant for the duration of a request."""
+
+    def __init__(self, pool: "TenantPool", conn: asyncpg.Connection, org_id: UUID):
+        self._pool, self._conn, self.org_id = pool, conn, org_id
+
+    async def _ensure_tenant(self):
+        if self._pool._pinned.get(self._conn) != self.org_id:
+            # Unknown until the SET returns: a request cancelled mid-statement must not leave the old pin behind
+            self._pool._pinned[self._conn] = None
+            await self._pool._prepared[self._conn]["__set_tenant"].fetchval(str(self.org_id))
+            self._pool._pinned[self._conn] = self.org_id
+            self._pool.stats.switched += 1
+        else:
+            self._pool.stats.pinned += 1
+
+    async def fetch(self, query: str, *args) -> list[asyncpg.Record]:
+        await self._ensure_tenant()
+        return await self._pool._prepared[self._conn][query].fetch(*args)
+
+    async def fetchrow(self, query: str, *args) -> asyncpg.Record | None:
+        await self._ensure_tenant()
+        return await self._pool._prepared[self._conn][query].fetchrow(*args)
+
+    @asynccontextmanager
+    async def transaction(self):
+        # The tenant switch rides on BEGIN (one simple-query message, no extra round trip).
+        # org_id is a UUID, so the literal cannot inject SQL.
+        # The pin is cleared until COMMIT returns: an interrupted BEGIN/COMMIT or a ROLLBACK leaves the
+        # session's app.org_id unknown, so the next checkout must send the SET again.
+        switch = self._pool._pinned.get(self._conn) != self.org_id
+        begin = f"BEGIN; SET app.org_id = '{UUID(str(self.org_id))}'" if switch else "BEGIN"
+        if switch:
+            self._pool._pinned[self._conn] = None
+        await self._conn.execute(begin)
+        try:
+            yield self._conn
+        except BaseException:
+            await self._conn.execute("ROLLBACK")
+            raise
+        await self._conn.execute("COMMIT")
+        if switch:
+            self._pool._pinned[self._conn] = self.org_id
+
+
+class TenantPool:
+    """Fixed-size pool whose idle connections stay pinned to the tenant they served last.
+
+    Checkout prefers a connection already pinned to the requested org (no SET at all); a freed
+    connection goes to the oldest waiter of its own org before the overall oldest waiter, bounded
+    by MAX_SKIPS so no tenant starves. Connections are never reset on release: app.org_id is
+    only ever changed by the next checkout, and a fresh connection has no tenant (RLS returns
+    no rows).
+    """
+
+    def __init__(self, dsn: str, size: int = 20, **connect_kwargs):
+        self._dsn, self._size, self._connect_kwargs = dsn, size, connect_kwargs
+        self._idle: OrderedDict[asyncpg.Connection, None] = OrderedDict()  # LRU order
+        self._idle_by_org: dict[UUID | None, list[asyncpg.Connection]] = defaultdict(list)
+        self._pinned: dict[asyncpg.Connection, UUID | None] = {}
+        self._prepared: dict[asyncpg.Connection, dict[str, asyncpg.prepared_stmt.PreparedStatement]] = {}
+        self._queue: deque[_Waiter] = deque()
+        self._queue_by_org: dict[UUID, deque[_Waiter]] = defaultdict(deque)
+        self.stats = PoolStats()
+
+    async def start(self):
+        for _ in range(self._size):
+            self._put_idle(await self._connect())
+
+    async def close(self):
+        await asyncio.gather(*(conn.close() for conn in self._pinned))
+
+    @asynccontextmanager
+    async def tenant(self, org_id: UUID):
+        started = time.perf_counter()
+        conn = await self._acquire(org_id)
+        acquired = time.perf_counter()
+        self.stats.wait_s.append(acquired - started)
+        try:
+            yield TenantConnection(self, conn, org_id)
+        finally:
+            self.stats.checkout_s.append(time.perf_counter() - acquired)
+            if conn.is_closed():
+                await self._replace(conn)
+            else:
+                self._release(conn)
+
+    async def _connect(self) -> asyncpg.Connection:
+        conn = await asyncpg.connect(self._dsn, **self._connect_kwargs)
+        self._prepared[conn] = {name: await conn.prepare(sql) for name, sql in HOT_QUERIES.items()}
+        self._prepared[conn]["__set_tenant"] = await conn.prepare(SET_TENANT)
+        self._pinned[conn] = None
+        return conn
+
+    def _put_idle(self, conn):
+        self._idle[conn] = None
+        self._idle_by_org[self._pinned[conn]].append(conn)
+
+    async def _acquire(self, org_id: UUID) -> asyncpg.Connection:
+        if self._idle:
+            same = self._idle_by_org.get(org_id)
+            if same:
+                conn = same.pop()  # Already pinned to this org
+            else:
+                conn = next(iter(self._idle))  # Least recently used, pinned to another org
+                self._idle_by_org[self._pinned[conn]].remove(conn)
+            del self._idle[conn]
+            return conn
+
+        waiter = _Waiter(org_id, asyncio.get_running_loop().create_future())
+        self._queue.append(waiter)
+        self._queue_by_org[org_id].append(waiter)
+        try:
+            return await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release(waiter.future.result())  # Handed over while being cancelled
+            raise
+
+    def _release(self, conn):
+        pinned = self._pinned[conn]
+        oldest = self._first_pending(self._queue)
+        if oldest is None:
+            self._put_idle(conn)
+            return
+        waiter = oldest
+        same = self._first_pending(self._queue_by_org.get(pinned)) if pinned is not None else None
+        if same is not None and same is not oldest and oldest.skipped < MAX_SKIPS:
+            oldest.skipped += 1
+            waiter = same
+        waiter.future.set_result(conn)  # Served waiters stay in the deques and are skipped lazily
+
+    @staticmethod
+    def _first_pending(waiters: deque | None) -> _Waiter | None:
+        while waiters and waiters[0].future.done():
+            waiters.popleft()
+        return waiters[0] if waiters else None
+
+    async def _replace(self, conn):
+        del self._pinned[conn], self._prepared[conn]
+        self._release(await self._connect())